@@ -1,21 +1,293 @@
 import os
+import base64
+import functools
+import time
 from pathlib import Path
 import re
-import uuid
+import secrets
 import subprocess
+import threading
+import queue
 from typing import Dict, Any, Optional, List, Callable
 import zipfile
 
 from .base import ToastNotifyPlatformBase
 from ...logger import log
 
+# PowerShell version string, e.g. "7.4.1"
+_VER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+# BurntToast switch parameters (parameters that don't take values)
+_SWITCH_PARAMS = frozenset(('silent', 'snooze_and_dismiss', 'suppress_popup'))
+
+# How long a PowerShell process waits for a button click before giving up.
+# A toast that times out moves to the Action Center and its events are not
+# raised again, so the wait also ends then.
+_EVENT_WAIT_SECONDS = 60
+
+# Cache of snake_case -> PascalCase parameter names
+_pascal_cache: Dict[str, str] = {}
+
+def _to_pascal_case(key: str) -> str:
+    """Convert a snake_case kwarg name to a PowerShell PascalCase parameter."""
+    ps_key = _pascal_cache.get(key)
+    if ps_key is None:
+        ps_key = _pascal_cache[key] = ''.join(word.capitalize() for word in key.split('_'))
+    return ps_key
+
+# Escape double quotes for PowerShell double-quoted strings
+_PS_ESCAPE = str.maketrans({'"': '`"'})
+
+# PowerShell value formatters keyed by exact value type, so bool is not
+# mistaken for int
+_PS_VALUE_FORMATTERS = {
+    bool: lambda v: "$True" if v else "$False",
+    int: str,
+    float: str,
+    str: lambda v: f'"{v.translate(_PS_ESCAPE)}"',
+}
+
+def _format_ps_value(value: Any) -> str:
+    """Format a BurntToast parameter value, falling back to a quoted string."""
+    formatter = _PS_VALUE_FORMATTERS.get(type(value))
+    if formatter:
+        return formatter(value)
+    return f'"{str(value).translate(_PS_ESCAPE)}"'
+
+def _ps_splat(params: Dict[str, str]) -> str:
+    """Render formatted parameters as a PowerShell hashtable for splatting."""
+    return "@{ " + "; ".join(f"{key} = {value}" for key, value in params.items()) + " }"
+
+@functools.lru_cache(maxsize=128)
+def _exists_cached(path: str, bucket: int) -> bool:
+    return os.path.exists(path)
+
+def _exists(path: str) -> bool:
+    """os.path.exists with a 5 second cache, icons are usually re-used between toasts."""
+    return _exists_cached(path, int(time.time()) // 5)
+
+def _burnt_toast_module_dirs() -> List[Path]:
+    """Return the directories BurntToast is usually installed to."""
+    documents = Path.home() / "Documents"
+    return [
+        documents / "WindowsPowerShell" / "Modules" / "BurntToast",
+        Path(os.environ.get("ProgramFiles", "C:/Program Files")) / "WindowsPowerShell" / "Modules" / "BurntToast",
+        documents / "PowerShell" / "Modules" / "BurntToast",
+    ]
+
+# Only the start of PowerShell's error output is worth logging
+_STDERR_LOG_LIMIT = 4096
+
+def _decode_stderr(stderr: Optional[bytes]) -> str:
+    """Decode (at most the first 4 KiB of) captured stderr for logging."""
+    if not stderr:
+        return "no error output"
+    return stderr[:_STDERR_LOG_LIMIT].decode(errors="replace").strip()
+
+def _encode_ps(ps_script: str) -> str:
+    """Encode a script as Base64 UTF-16LE, as -EncodedCommand expects it."""
+    return base64.b64encode(ps_script.encode("utf-16-le")).decode("ascii")
+
+def _powershell_args(powershell_path: str, ps_script: str, *options: str) -> List[str]:
+    """Build the argv to run a script through PowerShell's -EncodedCommand.
+
+    Passing the script as Base64 UTF-16LE skips the command line quoting
+    rules for long scripts. Extra options go before -EncodedCommand.
+    """
+    return [
+        powershell_path, "-NoProfile", "-NonInteractive", "-NoLogo",
+        *options, "-EncodedCommand", _encode_ps(ps_script)
+    ]
+
+@functools.lru_cache(maxsize=1)
 def _create_hidden_startupinfo():
-    """Create startupinfo object to hide console window"""
+    """Create startupinfo object to hide console window.
+
+    Cached, subprocess only reads it (and copies it before use). Shared
+    with install_burnttoast.
+    """
     startupinfo = subprocess.STARTUPINFO()
     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
     startupinfo.wShowWindow = 0  # SW_HIDE
     return startupinfo
 
+# Written by the persistent host once a script has finished
+_PS_HOST_DONE = "__AYON_PS_DONE__"
+
+# How long to wait for the persistent host to run a single script
+_PS_HOST_TIMEOUT = 30
+
+# Seconds before starting the host again after it failed to start, a cold
+# first start can time out while the BurntToast dlls are being scanned
+_PS_HOST_RETRY_DELAY = 60
+
+# Run once when the persistent host starts. BurntToast is imported a single
+# time and the notification call is compiled once, so every toast afterwards
+# is a plain scriptblock invocation: & $global:__bt_tmpl @{ ... }. A failed
+# import fails the bootstrap, toasts then fall back to one-shot runs.
+_PS_HOST_BOOTSTRAP = (
+    '$global:ProgressPreference = "SilentlyContinue"\n'
+    'if (-not $global:__bt_loaded) {\n'
+    '    Import-Module BurntToast -DisableNameChecking -ErrorAction Stop\n'
+    '    Set-Variable -Name __bt_loaded -Value $true -Scope Global\n'
+    '}\n'
+    "$global:__bt_tmpl = [scriptblock]::Create('param($p) New-BurntToastNotification @p')\n"
+)
+
+class PowerShellHostUnavailable(RuntimeError):
+    """The persistent PowerShell host could not be started or bootstrapped.
+
+    The script was not run, so it is safe to run it some other way.
+    """
+
+class _PowerShellHost:
+    """Long-lived PowerShell process running scripts written to its stdin.
+
+    Each script is sent as a single line that decodes and invokes it, then
+    writes a done marker with the result to stdout.
+    """
+
+    def __init__(self, powershell_path: str):
+        self.powershell_path = powershell_path
+        self._process = None
+        self._output = None
+        # monotonic time before which no new start is attempted
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def run(self, ps_script: str):
+        """Run a script in the host.
+
+        Returns:
+            tuple: (success, error message)
+
+        Raises:
+            PowerShellHostUnavailable: If the host can't be started.
+            RuntimeError: If the host stopped responding after the script
+                was sent, the script may have run.
+        """
+        with self._lock:
+            self._ensure_started()
+            return self._send(ps_script)
+
+    def stop(self):
+        """Stop the host process, it is started again on the next run."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except Exception:
+            process.kill()
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        if time.monotonic() < self._retry_at:
+            raise PowerShellHostUnavailable("PowerShell host failed to start recently")
+
+        self._output = queue.Queue()
+        try:
+            self._process = subprocess.Popen(
+                [self.powershell_path, "-NoProfile", "-NonInteractive", "-NoLogo", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors="replace",
+                bufsize=1,
+                startupinfo=_create_hidden_startupinfo()
+            )
+        except OSError as e:
+            self._retry_at = time.monotonic() + _PS_HOST_RETRY_DELAY
+            raise PowerShellHostUnavailable(f"Could not start PowerShell host: {e}")
+        threading.Thread(
+            target=self._read_output,
+            args=(self._process, self._output),
+            daemon=True
+        ).start()
+
+        try:
+            ok, error = self._send(_PS_HOST_BOOTSTRAP)
+        except RuntimeError:
+            ok, error = False, "no response"
+        if not ok:
+            self._retry_at = time.monotonic() + _PS_HOST_RETRY_DELAY
+            self._stop()
+            raise PowerShellHostUnavailable(f"PowerShell host bootstrap failed: {error}")
+        log.debug(f"Started persistent PowerShell host: {self.powershell_path}")
+
+    @staticmethod
+    def _read_output(process, output):
+        for line in process.stdout:
+            output.put(line)
+        output.put(None)
+
+    def _send(self, ps_script: str):
+        encoded = _encode_ps(ps_script)
+        line = (
+            "try { "
+            "& ([scriptblock]::Create([Text.Encoding]::Unicode.GetString("
+            f"[Convert]::FromBase64String('{encoded}')))) *> $null; "
+            f"[Console]::Out.WriteLine('{_PS_HOST_DONE} OK') "
+            "} catch { "
+            f"[Console]::Out.WriteLine('{_PS_HOST_DONE} ERROR ' + (\"$_\" -replace '\\r?\\n', ' ')) "
+            "}\n"
+        )
+        try:
+            self._process.stdin.write(line)
+            self._process.stdin.flush()
+        except OSError as e:
+            # The script never reached the host
+            self._stop()
+            raise PowerShellHostUnavailable(f"PowerShell host is not running: {e}")
+
+        while True:
+            try:
+                out = self._output.get(timeout=_PS_HOST_TIMEOUT)
+            except queue.Empty:
+                self._stop()
+                raise RuntimeError("PowerShell host timed out")
+            if out is None:
+                self._stop()
+                raise RuntimeError("PowerShell host exited")
+            if out.startswith(_PS_HOST_DONE):
+                status, _, error = out[len(_PS_HOST_DONE):].strip().partition(" ")
+                return status == "OK", error
+
+# Persistent hosts by PowerShell executable
+_ps_hosts: Dict[str, _PowerShellHost] = {}
+_ps_hosts_lock = threading.Lock()
+
+def _get_powershell_host(powershell_path: str) -> _PowerShellHost:
+    """Return the shared persistent host for a PowerShell executable."""
+    with _ps_hosts_lock:
+        host = _ps_hosts.get(powershell_path)
+        if host is None:
+            host = _ps_hosts[powershell_path] = _PowerShellHost(powershell_path)
+        return host
+
+def run_in_powershell_host(powershell_path: str, ps_script: str):
+    """Run a script in the persistent PowerShell host the toasts are sent to.
+
+    The host has BurntToast imported already. The script must not call
+    exit, that would end the host.
+
+    Returns:
+        tuple: (success, error message)
+
+    Raises:
+        PowerShellHostUnavailable: If the host can't be started.
+        RuntimeError: If the host stopped responding after the script was
+            sent, the script may have run.
+    """
+    return _get_powershell_host(powershell_path).run(ps_script)
+
 class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
     """Windows implementation using BurntToast PowerShell module."""
 
@@ -24,13 +296,8 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
         self.powershell_path = settings.get("windows_powershell_path", "powershell.exe")
         self.app_id = settings.get("app_id", "AYON.ToastNotify")
 
-        #@TODO: We shouldn't have to do this on every Platform initialization.
-        self.burnt_toast_available = self._check_burnt_toast_available()
-
-        #This probably needs to be done on every launch, but we can optimize it later
-        self.powershell_version = self._get_powershell_version()
-        self.supports_events = self._check_events_supported()
-        log.debug(f"PowerShell version: {self.powershell_version}, Events supported: {self.supports_events}")
+        # PowerShell version, BurntToast availability and event support are
+        # probed lazily on first use, see the properties below
         log.info(f"ToastNotifyWindowsPlatform initialized with PowerShell path: {self.powershell_path}")
 
         #@TODO: We shouldn't have to do this on every Platform initialization.
@@ -40,35 +307,30 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
         self.urlprotocol_registered =  self._ensure_silent_protocol_handler(settings.get("port", os.environ.get("AYON_TOASTNOTIFY_PORT", "5127")))
         log.debug(f"URL protocol handler registered: {self.urlprotocol_registered}")
 
-        #Use regular string instead of f-string for command template
-        self._ps_command = (
-            '$ProgressPreference = "SilentlyContinue"; '
-            'if (-not (Get-Module BurntToast)) { Import-Module BurntToast -DisableNameChecking -Force }; '
-            'New-BurntToastNotification -Text "{0}", "{1}" {2} -AppId "{3}"'
-        )
+        # PowerShell processes kept alive to report button clicks (PowerShell 7.1+).
+        # A set, the worker threads discard their own process while cleanup()
+        # may be clearing it
+        self._active_processes = set()
+        self._active_threads = []
 
-    def _get_powershell_version(self):
-        """Get the PowerShell version."""
-        try:
-            result = subprocess.run(
-                [
-                    self.powershell_path,
-                    "-NoProfile",
-                    "-Command",
-                    "$PSVersionTable.PSVersion.ToString()"
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                startupinfo=_create_hidden_startupinfo()
-            )
+    @functools.cached_property
+    def _powershell_probe(self):
+        """Version and BurntToast availability, from a single PowerShell run."""
+        return self._probe_powershell()
 
-            if result.returncode == 0 and result.stdout:
-                return result.stdout.strip()
-            return "Unknown"
-        except Exception as e:
-            log.error(f"Error getting PowerShell version: {e}")
-            return "Unknown"
+    @property
+    def powershell_version(self) -> str:
+        return self._powershell_probe[0]
+
+    @property
+    def burnt_toast_available(self) -> bool:
+        return self._powershell_probe[1]
+
+    @functools.cached_property
+    def supports_events(self) -> bool:
+        supported = self._check_events_supported()
+        log.debug(f"PowerShell version: {self.powershell_version}, Events supported: {supported}")
+        return supported
 
     def _check_events_supported(self):
         """Check if PowerShell version supports toast events."""
@@ -77,7 +339,7 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
                 return False
 
             # Parse the version string
-            match = re.match(r"(\d+)\.(\d+)\.(\d+)", self.powershell_version)
+            match = _VER_RE.match(self.powershell_version)
             if match:
                 major, minor, build = map(int, match.groups())
                 # PowerShell 7.1.0 or higher supports events
@@ -86,59 +348,57 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
         except Exception:
             return False
 
-    def _check_burnt_toast_available(self) -> bool:
-        """Check if BurntToast module is available."""
-        try:
-            # More thorough check with better error handling
-            ps_script = """
-            $ProgressPreference = "SilentlyContinue"
-            try {
-                # Check for module by path first (for bundled version)
-                $userModules = Join-Path -Path ([Environment]::GetFolderPath('MyDocuments')) -ChildPath "WindowsPowerShell\\Modules\\BurntToast"
-                $systemModules = "$env:ProgramFiles\\WindowsPowerShell\\Modules\\BurntToast"
-
-                if ((Test-Path $userModules) -or (Test-Path $systemModules)) {
-                    # Import to verify it loads properly
-                    Import-Module BurntToast -DisableNameChecking -Force
-
-                    # Try a basic function to confirm it's working
-                    $null = [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime]
-                    Write-Output "BurntToast module is available and working"
-                    exit 0
-                }
+    def _probe_powershell(self):
+        """Get the PowerShell version and check if BurntToast is available.
 
-                # Try standard module check as fallback
-                if (Get-Module -ListAvailable BurntToast) {
-                    Write-Output "BurntToast module is available"
-                    exit 0
-                }
+        Both are answered by one PowerShell run that writes tagged lines
+        ("PSV=..." and "BT=...") to stdout.
 
-                Write-Output "BurntToast module is NOT available"
-                exit 1
-            } catch {
-                Write-Output "Error checking BurntToast: $_"
-                exit 1
-            }
-            """
+        Returns:
+            tuple: (version string or "Unknown", BurntToast available)
+        """
+        # Look in the usual install locations first, this avoids asking
+        # PowerShell for the (slow) module listing when it is where we expect it
+        burnt_toast_dir = next((d for d in _burnt_toast_module_dirs() if d.is_dir()), None)
+        if burnt_toast_dir:
+            log.info(f"BurntToast module is available at {burnt_toast_dir}")
 
+        ps_script = (
+            '$ProgressPreference = "SilentlyContinue"\n'
+            'Write-Output ("PSV=" + $PSVersionTable.PSVersion.ToString())\n'
+        )
+        if not burnt_toast_dir:
+            # Fall back to PowerShell to respect $PSModulePath overrides
+            ps_script += 'Write-Output ("BT=" + [bool](Get-Module -ListAvailable BurntToast))\n'
+
+        version = "Unknown"
+        burnt_toast_available = burnt_toast_dir is not None
+        try:
             result = subprocess.run(
-                [self.powershell_path, "-NoProfile", "-Command", ps_script],
+                _powershell_args(self.powershell_path, ps_script),
                 capture_output=True,
                 text=True,
                 check=False,
                 startupinfo=_create_hidden_startupinfo()
             )
 
-            if "is available" in result.stdout and result.returncode == 0:
-                log.info("BurntToast module is available")
-                return True
-            else:
-                log.warning(f"BurntToast module check failed: {result.stdout}")
-                return False
+            for line in result.stdout.splitlines():
+                key, _, value = line.strip().partition("=")
+                if key == "PSV" and value:
+                    version = value
+                elif key == "BT":
+                    burnt_toast_available = value == "True"
+
+            if burnt_toast_dir is None:
+                if burnt_toast_available:
+                    log.info("BurntToast module is available")
+                else:
+                    log.warning(f"BurntToast module check failed: {result.stdout or result.stderr}")
 
         except Exception as e:
-            log.error(f"Error checking for BurntToast: {e}")
-            return False
+            log.error(f"Error probing PowerShell: {e}")
+
+        return version, burnt_toast_available
 
     def _ensure_app_id(self, app_id):
         """Ensure the specified app ID is registered for BurntToast."""
@@ -148,9 +408,6 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
             $ProgressPreference = "SilentlyContinue"
 
             try {{
-                # Load BurntToast module
-                Import-Module BurntToast -DisableNameChecking -Force
-
                 # Directly create registry key for AppId (more reliable than New-BTAppId)
                 $path = "HKCU:\\SOFTWARE\\Classes\\AppUserModelId\\{app_id}"
 
@@ -177,7 +434,7 @@ class ToastNotifyWindowsPlatform(ToastNotifyPlatformBase):
             """
 
             result = subprocess.run(
-                [self.powershell_path, "-NoProfile", "-Command", ps_cmd],
+                _powershell_args(self.powershell_path, ps_cmd),
                 capture_output=True,
                 text=True,
                 check=False,
@@ -341,7 +598,7 @@ try {{
 
             # Execute the registration script
             result = subprocess.run(
-                [self.powershell_path, "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
+                _powershell_args(self.powershell_path, ps_script, "-ExecutionPolicy", "Bypass"),
                 capture_output=True,
                 text=True,
                 check=False,
@@ -435,28 +692,21 @@ try {{
             title = title.replace('"', '`"')
             message = message.replace('"', '`"')
 
-            # Define switch parameters (parameters that don't take values)
-            switch_params = ['silent', 'snooze_and_dismiss', 'suppress_popup']
-
-            # Prepare parameter parts for PowerShell command
-            param_parts = []
-            switch_parts = []
-
-            # Add basic text parameter
-            param_parts.append(f'-Text @("{title}", "{message}")')
-
-            # Add AppId
-            param_parts.append(f'-AppId "{self.app_id}"')
+            # New-BurntToastNotification parameters, values formatted for PowerShell
+            params = {
+                "Text": f'@("{title}", "{message}")',
+                "AppId": f'"{self.app_id}"',
+            }
 
             # Add icon if provided
-            if icon and os.path.exists(icon):
+            if icon and _exists(icon):
                 icon_path = icon.replace('\\', '/').replace('"', '`"')
-                param_parts.append(f'-AppLogo "{icon_path}"')
+                params["AppLogo"] = f'"{icon_path}"'
 
             # Add hero image if provided
-            if hero_image and os.path.exists(hero_image):
+            if hero_image and _exists(hero_image):
                 hero_path = hero_image.replace('\\', '/').replace('"', '`"')
-                param_parts.append(f'-HeroImage "{hero_path}"')
+                params["HeroImage"] = f'"{hero_path}"'
 
             # Process additional kwargs as BurntToast parameters
             for key, value in kwargs.items():
@@ -465,67 +715,22 @@ try {{
                     continue
 
                 # Convert snake_case to PascalCase for PowerShell
-                ps_key = ''.join(word.capitalize() for word in key.split('_'))
+                ps_key = _to_pascal_case(key)
 
                 # Handle switch parameters (boolean flags)
-                if key.lower() in switch_params:
+                if key.lower() in _SWITCH_PARAMS:
                     if value:
-                        switch_parts.append(f'-{ps_key}')
+                        params[ps_key] = "$True"
                     continue
 
                 # Handle other parameter types
-                if isinstance(value, bool):
-                    if value:
-                        param_parts.append(f'-{ps_key} $True')
-                    else:
-                        param_parts.append(f'-{ps_key} $False')
-                elif isinstance(value, (int, float)):
-                    param_parts.append(f'-{ps_key} {value}')
-                elif isinstance(value, str):
-                    value_esc = value.replace('"', '`"')
-                    param_parts.append(f'-{ps_key} "{value_esc}"')
-                elif value is not None:
-                    # Convert everything else to string
-                    value_esc = str(value).replace('"', '`"')
-                    param_parts.append(f'-{ps_key} "{value_esc}"')
-
-            # Combine all parameters
-            all_params = ' '.join(param_parts + switch_parts)
-
-            # Build the PowerShell command
-            ps_script = f"""
-            $ErrorActionPreference = "Continue"
-            $ProgressPreference = "SilentlyContinue"
-
-            try {{ 
-                # Guarantee module is loaded
-                Import-Module BurntToast -DisableNameChecking -Force
-
-                # Create and show notification with direct parameters
-                New-BurntToastNotification {all_params}
-
-                Write-Host "Notification sent successfully" 
-            }} catch {{ 
-                Write-Host "ERROR: $_"
-                exit 1
-            }}
-            """
-
-            # Run the PowerShell command
-            log.debug(f"Running PowerShell command: {ps_script}")
-            result = subprocess.run(
-                [self.powershell_path, "-NoProfile", "-Command", ps_script],
-                capture_output=True,
-                text=True,
-                check=False,
-                startupinfo=_create_hidden_startupinfo()
-            )
+                if value is not None:
+                    params[ps_key] = _format_ps_value(value)
 
-            if result.returncode != 0:
-                log.error(f"Failed to show notification: {result.stderr or result.stdout}")
+            if not self._send_burnt_toast(params):
                 return False
 
-            log.info(f"Notification result: {result.stdout.strip()}")
+            log.info("Notification sent successfully")
             return True
         except Exception as e:
             log.error(f"Error showing Windows notification: {e}")
@@ -548,104 +753,262 @@ try {{
                     title, message, icon, actions=actions, **kwargs
                 )
 
+            # Escape quotes for PowerShell
+            title = title.replace('"', '`"')
+            message = message.replace('"', '`"')
+
+            # New-BurntToastNotification parameters, values formatted for PowerShell
+            params = {
+                "Text": f'@("{title}", "{message}")',
+                "AppId": f'"{self.app_id}"',
+            }
+
+            # Add icon if provided
+            if icon and _exists(icon):
+                icon_path = icon.replace('\\', '/').replace('"', '`"')
+                params["AppLogo"] = f'"{icon_path}"'
+
+            # Handle hero image if provided
+            if "hero_image" in kwargs and kwargs.get("hero_image") is not None:
+                hero_path = kwargs["hero_image"]
+                if _exists(hero_path):
+                    hero_path = hero_path.replace('\\', '/').replace('"', '`"')
+                    params["HeroImage"] = f'"{hero_path}"'
+
+            # PowerShell 7.1+ can subscribe to the toast's Activated event, so
+            # clicks are reported in-process instead of through the protocol handler
+            if self.supports_events:
+                return self._show_notification_with_events(params, actions, on_action)
+
             # Generate a unique ID for this notification
-            notification_id = str(uuid.uuid4())
+            notification_id = secrets.token_hex(8)
 
             # Register the callback in our registry
             from ..notification_manager import register_action_callback
             register_action_callback(notification_id, on_action)
 
-            # Escape quotes for PowerShell
-            title = title.replace('"', '`"')
-            message = message.replace('"', '`"')
-
             # Create buttons with CUSTOM PROTOCOL URLs
-            buttons_script = []
-            button_vars = []
-
+            buttons = []
             for idx, action in enumerate(actions):
                 action_id = action.get("id", f"action_{idx}")
                 button_text = action.get("text", "Button").replace('"', '`"')
-                var_name = f"$btn{idx}"
 
                 # Use our custom protocol instead of HTTP
                 protocol_url = f"ayontoast://{notification_id}/{action_id}"
 
-                buttons_script.append(
-                    f'{var_name} = New-BTButton -Content "{button_text}" '
-                    f'-Arguments "{protocol_url}" -ActivationType Protocol'
+                buttons.append(
+                    f'(New-BTButton -Content "{button_text}" '
+                    f'-Arguments "{protocol_url}" -ActivationType Protocol)'
                 )
-                button_vars.append(var_name)
 
-            # Add icon if provided
-            icon_param = ""
-            if icon and os.path.exists(icon):
-                icon_path = icon.replace('\\', '/').replace('"', '`"')
-                icon_param = f'-AppLogo "{icon_path}"'
+            params["Button"] = f"@({', '.join(buttons)})"
+            params["UniqueIdentifier"] = f'"{notification_id}"'
 
-            # Handle hero image if provided
-            hero_param = ""
-            if "hero_image" in kwargs and kwargs.get("hero_image") is not None:
-                hero_path = kwargs["hero_image"]
-                if os.path.exists(hero_path):
-                    hero_path = hero_path.replace('\\', '/').replace('"', '`"')
-                    hero_param = f'-HeroImage "{hero_path}"'
+            # Log a simple message without the full script (avoids Unicode issues)
+            log.debug(f"Creating notification with buttons: {title} ({len(actions)} buttons)")
+
+            if not self._send_burnt_toast(params):
+                return False
+
+            log.info("Notification with buttons sent successfully")
+            return True
+
+        except Exception as e:
+            log.error(f"Error showing notification with buttons: {e}")
+            return False
+
+    def _send_burnt_toast(self, params: Dict[str, str]) -> bool:
+        """Run New-BurntToastNotification with already formatted parameters.
+
+        Goes through the persistent PowerShell host, which has BurntToast
+        loaded already, and falls back to a one-shot PowerShell run when the
+        host can't be started.
+        """
+        splat = _ps_splat(params)
+
+        try:
+            ok, error = _get_powershell_host(self.powershell_path).run(
+                f"& $global:__bt_tmpl {splat}"
+            )
+        except PowerShellHostUnavailable as e:
+            log.debug(f"PowerShell host unavailable, using a one-shot run: {e}")
+        except Exception as e:
+            # The toast may have been shown already, another run could
+            # show it twice
+            log.error(f"Failed to show notification: {e}")
+            return False
+        else:
+            if not ok:
+                log.error(f"Failed to show notification: {error}")
+            return ok
+
+        ps_script = (
+            "$ErrorActionPreference = \"Continue\"\n"
+            "$ProgressPreference = \"SilentlyContinue\"\n"
+            "\n"
+            "try {\n"
+            "    Import-Module BurntToast -DisableNameChecking\n"
+            f"    $params = {splat}\n"
+            "    New-BurntToastNotification @params\n"
+            "} catch {\n"
+            "    [Console]::Error.WriteLine(\"ERROR: $_\")\n"
+            "    exit 1\n"
+            "}\n"
+        )
+
+        result = subprocess.run(
+            _powershell_args(self.powershell_path, ps_script),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+            startupinfo=_create_hidden_startupinfo()
+        )
+
+        if result.returncode != 0:
+            log.error(f"Failed to show notification: {_decode_stderr(result.stderr)}")
+            return False
+        return True
+
+    def _show_notification_with_events(
+        self,
+        params: Dict[str, str],
+        actions: List[Dict[str, Any]],
+        on_action: Callable[[str], None]
+    ) -> bool:
+        """Show a notification with buttons using BurntToast's ActivatedAction.
+
+        The PowerShell process stays alive until the toast is clicked or
+        dismissed and writes the clicked action id to stdout, which is read
+        on a background thread. This needs its own process rather than the
+        persistent host, since it blocks until the user responds.
+        """
+        try:
+            buttons = []
+            for idx, action in enumerate(actions):
+                action_id = str(action.get("id", f"action_{idx}")).replace('"', '`"')
+                button_text = action.get("text", "Button").replace('"', '`"')
+
+                # The button arguments are handed back to the ActivatedAction handler
+                buttons.append(f'(New-BTButton -Content "{button_text}" -Arguments "{action_id}")')
+
+            params = dict(params, Button=f"@({', '.join(buttons)})")
 
-            # Build PowerShell script
             ps_script = (
                 "$ErrorActionPreference = \"Continue\"\n"
                 "$ProgressPreference = \"SilentlyContinue\"\n"
+                "$global:AyonToastDone = $false\n"
                 "\n"
                 "try {\n"
                 "    # Import module\n"
-                "    Import-Module BurntToast -DisableNameChecking -Force\n"
+                "    Import-Module BurntToast -DisableNameChecking\n"
                 "\n"
-                "    # Define buttons\n"
-                "    " + "\n    ".join(buttons_script) + "\n"
+                "    # Report clicks on stdout, stop waiting once the toast is gone from the screen\n"
+                "    $onActivated = {\n"
+                "        [Console]::Out.WriteLine(\"ACTION=\" + $Event.SourceArgs[1].Arguments)\n"
+                "        [Console]::Out.Flush()\n"
+                "        $global:AyonToastDone = $true\n"
+                "    }\n"
+                "    $onDismissed = { $global:AyonToastDone = $true }\n"
                 "\n"
                 "    # Create and show notification\n"
-                f"    New-BurntToastNotification -Text @(\"{title}\", \"{message}\") {icon_param} {hero_param} -Button @({', '.join(button_vars)}) -AppId \"{self.app_id}\" -UniqueIdentifier \"{notification_id}\"\n"
+                f"    $params = {_ps_splat(params)}\n"
+                "    New-BurntToastNotification @params -ActivatedAction $onActivated -DismissedAction $onDismissed\n"
                 "\n"
-                "    Write-Output \"Notification with buttons sent successfully\"\n"
+                "    # Keep the session alive so the event handlers can run\n"
+                f"    $deadline = (Get-Date).AddSeconds({_EVENT_WAIT_SECONDS})\n"
+                "    while (-not $global:AyonToastDone -and (Get-Date) -lt $deadline) {\n"
+                "        Wait-Event -Timeout 1 | Out-Null\n"
+                "    }\n"
                 "} catch {\n"
                 "    Write-Output \"ERROR: $_\"\n"
                 "    exit 1\n"
                 "}\n"
             )
 
-            # Log a simple message without the full script (avoids Unicode issues)
-            log.debug(f"Creating notification with buttons: {title} ({len(actions)} buttons)")
+            log.debug(f"Creating notification with event buttons ({len(actions)} buttons)")
 
-            # Run the PowerShell command
-            result = subprocess.run(
-                [self.powershell_path, "-NoProfile", "-Command", ps_script],
-                capture_output=True,
+            process = subprocess.Popen(
+                _powershell_args(self.powershell_path, ps_script),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                check=False,
                 startupinfo=_create_hidden_startupinfo()
             )
+            self._active_processes.add(process)
 
-            if result.returncode != 0:
-                log.error(f"Failed to show notification: {result.stderr or result.stdout}")
-                return False
-
-            log.info(f"Notification with buttons result: {result.stdout.strip()}")
+            t = threading.Thread(
+                target=self._process_activation,
+                args=(process, on_action),
+                daemon=True
+            )
+            # Drop the threads of toasts that were already answered
+            self._active_threads = [
+                thread for thread in self._active_threads if thread.is_alive()
+            ]
+            self._active_threads.append(t)
+            t.start()
             return True
 
         except Exception as e:
-            log.error(f"Error showing notification with buttons: {e}")
+            log.error(f"Error showing notification with event buttons: {e}")
             return False
 
+    def _process_activation(self, process, on_action):
+        """Wait for the ActivatedAction handler to report a click and run the callback."""
+        try:
+            for line in process.stdout:
+                line = line.strip()
+                if line.startswith("ACTION="):
+                    action_id = line[len("ACTION="):]
+                    log.info(f"Button clicked: action={action_id}")
+                    try:
+                        on_action(action_id)
+                    except Exception as e:
+                        log.error(f"Error in action callback: {e}")
+                    break
+                if line.startswith("ERROR:"):
+                    log.error(f"Failed to show notification: {line}")
+        except Exception as e:
+            log.debug(f"Stopped waiting for notification activation: {e}")
+        finally:
+            try:
+                process.stdout.close()
+            except Exception:
+                pass
+            # Reap the process, it exits within a second of the toast being
+            # answered
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            except Exception as e:
+                log.debug(f"Could not wait for notification process: {e}")
+            self._active_processes.discard(process)
+
+    def cleanup(self):
+        """Stop the persistent host and any PowerShell processes still waiting for button clicks."""
+        _get_powershell_host(self.powershell_path).stop()
+        for proc in list(self._active_processes):
+            try:
+                if proc.poll() is None:
+                    proc.terminate()
+            except Exception as e:
+                log.warning(f"Failed to terminate process: {e}")
+        self._active_processes.clear()
+        for t in self._active_threads:
+            try:
+                if t.is_alive():
+                    t.join(timeout=2)
+            except Exception as e:
+                log.warning(f"Failed to join thread: {e}")
+        self._active_threads.clear()
+
     def _ensure_burnttoast_module(self):
         """Ensure BurntToast PowerShell module is available."""
         try:
             # Check if BurntToast is already installed
-            check_cmd = [
-                self.powershell_path,
-                "-NoProfile",
-                "-Command",
-                "Get-Module -ListAvailable BurntToast"
-            ]
+            check_cmd = _powershell_args(self.powershell_path, "Get-Module -ListAvailable BurntToast")
             result = subprocess.run(
                 check_cmd,
                 capture_output=True,
@@ -1,62 +1,109 @@
 import os
-import sys
 import subprocess
-import platform
 from pathlib import Path
 
-def debug_alerter():
+def _probe_alerter(alerter_path, timeout=5):
+    """Run the alerter binary once for -help and once for a test notification.
+
+    The test notification is only sent if -help succeeded. Returns a dict with
+    the results so both entry points can share a single probe.
+    """
+    probe = {
+        "exists": os.path.exists(alerter_path),
+        "executable": False,
+        "help_rc": None,
+        "help_out": "",
+        "help_err": "",
+        "notify_rc": None,
+        "notify_out": "",
+        "notify_err": "",
+        "error": None,
+    }
+    if not probe["exists"]:
+        return probe
+
+    probe["executable"] = os.access(alerter_path, os.X_OK)
+
+    try:
+        result = subprocess.run(
+            [str(alerter_path), "-help"],
+            capture_output=True, text=True, timeout=timeout
+        )
+        probe["help_rc"] = result.returncode
+        probe["help_out"] = result.stdout
+        probe["help_err"] = result.stderr
+    except Exception as e:
+        probe["error"] = f"Exception executing alerter: {e}"
+        return probe
+
+    if probe["help_rc"] != 0:
+        return probe
+
+    cmd = [str(alerter_path), "-title", "Test", "-message", "Direct test message", "-timeout", "5"]
+    try:
+        # The notification itself times out after 5 seconds, give it some headroom
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 5)
+        probe["notify_rc"] = result.returncode
+        probe["notify_out"] = result.stdout
+        probe["notify_err"] = result.stderr
+    except Exception as e:
+        probe["error"] = f"Exception sending notification: {e}"
+
+    return probe
+
+def debug_alerter(probe=None):
     """Debug function to check alerter functionality directly."""
     alerter_path = Path.home() / ".ayon" / "apps" / "Alerter.app" / "Contents" / "MacOS" / "alerter"
-    
+    if probe is None:
+        probe = _probe_alerter(alerter_path)
+
     print(f"Checking if alerter exists at {alerter_path}...")
-    if os.path.exists(alerter_path):
+    if probe["exists"]:
         print(f"SUCCESS: Alerter binary found at {alerter_path}")
-        if os.access(alerter_path, os.X_OK):
+        if probe["executable"]:
             print("SUCCESS: Alerter binary is executable")
         else:
             print("ERROR: Alerter binary is not executable")
     else:
         print(f"ERROR: Alerter binary not found at {alerter_path}")
         return
-    
+
     print("\nTesting alerter binary directly...")
-    cmd = [str(alerter_path), "-help"]
-    print(f"Running command: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        print(f"Return code: {result.returncode}")
-        print(f"Output: {result.stdout}")
-        print(f"Error: {result.stderr}")
-    except Exception as e:
-        print(f"ERROR: Exception executing alerter: {e}")
-    
+    print(f"Running command: {alerter_path} -help")
+    if probe["help_rc"] is not None:
+        print(f"Return code: {probe['help_rc']}")
+        print(f"Output: {probe['help_out']}")
+        print(f"Error: {probe['help_err']}")
+
     print("\nSending direct test notification...")
-    cmd = [str(alerter_path), "-title", "Test", "-message", "Direct test message", "-timeout", "5"]
-    print(f"Running command: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        print(f"Return code: {result.returncode}")
-        print(f"Output: {result.stdout}")
-        print(f"Error: {result.stderr}")
-    except Exception as e:
-        print(f"ERROR: Exception sending notification: {e}")
-    
+    if probe["notify_rc"] is not None:
+        print(f"Return code: {probe['notify_rc']}")
+        print(f"Output: {probe['notify_out']}")
+        print(f"Error: {probe['notify_err']}")
+    elif probe["error"]:
+        print(f"ERROR: {probe['error']}")
+    else:
+        print("Skipped: alerter -help did not succeed")
+
     print("\nChecking app bundle structure...")
     app_path = Path.home() / ".ayon" / "apps" / "Alerter.app"
     print(f"App bundle path: {app_path}")
-    
+
     info_plist = app_path / "Contents" / "Info.plist"
     print(f"Info.plist exists: {os.path.exists(info_plist)}")
-    
+
     pkg_info = app_path / "Contents" / "PkgInfo"
     print(f"PkgInfo exists: {os.path.exists(pkg_info)}")
-    
+
     print("\nApp bundle permissions:")
     try:
-        subprocess.run(["ls", "-la", str(app_path)], check=False)
+        with os.scandir(app_path) as entries:
+            for entry in entries:
+                st = entry.stat(follow_symlinks=False)
+                print(f"{oct(st.st_mode & 0o7777)} {st.st_size:>10} {entry.name}")
     except Exception as e:
         print(f"ERROR: Failed to get permissions: {e}")
-    
+
     # Try using terminal-notifier as an alternative
     print("\nTesting terminal-notifier:")
     try:
@@ -64,7 +111,7 @@ def debug_alerter():
         if result.returncode == 0:
             terminal_notifier_path = result.stdout.strip()
             print(f"terminal-notifier found at: {terminal_notifier_path}")
-            
+
             # Test notification with terminal-notifier
             test_cmd = [terminal_notifier_path, "-title", "Test", "-message", "Terminal Notifier Test"]
             subprocess.run(test_cmd, check=False)
@@ -74,39 +121,33 @@ def debug_alerter():
     except Exception as e:
         print(f"ERROR: Failed to test terminal-notifier: {e}")
 
-def run_direct_test():
+def run_direct_test(probe=None):
     """Run a direct test of the alerter binary."""
     alerter_path = Path.home() / ".ayon" / "apps" / "Alerter.app" / "Contents" / "MacOS" / "alerter"
-    
-    if not os.path.exists(alerter_path):
+    if probe is None:
+        probe = _probe_alerter(alerter_path)
+
+    if not probe["exists"]:
         print(f"ERROR: Alerter binary not found at {alerter_path}")
         return
-    
+
     print(f"Alerter binary found at {alerter_path}")
-    
-    # Try running with direct command
-    try:
-        cmd = [str(alerter_path), "-title", "Direct Test", "-message", "Testing direct command", "-timeout", "5"]
-        print(f"Running command: {' '.join(cmd)}")
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        print(f"Return code: {result.returncode}")
-        print(f"Stdout: {result.stdout}")
-        print(f"Stderr: {result.stderr}")
-        
-        if result.returncode == 0:
-            print("SUCCESS: Direct command worked!")
-        else:
-            print(f"ERROR: Direct command failed with code {result.returncode}")
-    except Exception as e:
-        print(f"ERROR: Exception running direct command: {e}")
+
+    if probe["notify_rc"] is None:
+        print(f"ERROR: Direct command was not run: {probe['error'] or 'alerter -help did not succeed'}")
+        return
+
+    print(f"Return code: {probe['notify_rc']}")
+    print(f"Stdout: {probe['notify_out']}")
+    print(f"Stderr: {probe['notify_err']}")
+
+    if probe["notify_rc"] == 0:
+        print("SUCCESS: Direct command worked!")
+    else:
+        print(f"ERROR: Direct command failed with code {probe['notify_rc']}")
 
 if __name__ == "__main__":
-    debug_alerter()
-    run_direct_test()
\ No newline at end of file
+    alerter_path = Path.home() / ".ayon" / "apps" / "Alerter.app" / "Contents" / "MacOS" / "alerter"
+    probe = _probe_alerter(alerter_path)
+    debug_alerter(probe)
+    run_direct_test(probe)
@@ -1,158 +1,41 @@
 import os
 import shutil
 import platform
+import time
 import threading
 import subprocess
+import tempfile
+import contextlib
+import concurrent.futures
 from pathlib import Path
-from qtpy import QtWidgets, QtCore
-_installation_lock = threading.Lock()
-_installation_completed = False
-_installation_result = None
-_installation_in_progress = False  # This was missing
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+_installation_lock = threading.RLock()
+# Signalled when an installation finishes, see _ensure_alerter_available
+_installation_cond = threading.Condition(_installation_lock)
+# Only read or modified while holding _installation_lock
+_install_state = {"completed": False, "in_progress": False, "result": None}
+# Background installation shared by all install_alerter calls
+_install_future = None
+# Seconds an install_alerter call waits for a running installation, in this
+# process or another one
+_INSTALL_WAIT_TIMEOUT = 60
 
 from . import AYON_TOASTNOTIFY_ROOT
 from .logger import log
 
+_IS_DARWIN = platform.system() == "Darwin"
+_IS_ARM64 = platform.machine() == "arm64"
 
-def _fix_alerter_permissions(app_path):
-    """Fix permissions and security settings for the alerter app bundle."""
-    try:
-        alerter_exe = app_path / "Contents" / "MacOS" / "alerter"
-        
-        if not os.path.exists(app_path):
-            log.error(f"Cannot fix permissions: App bundle not found at {app_path}")
-            return False
-            
-        if not os.path.exists(alerter_exe):
-            log.error(f"Cannot fix permissions: Executable not found at {alerter_exe}")
-            return False
-        
-        # Set executable permissions
-        try:
-            os.chmod(alerter_exe, 0o755)
-            log.debug(f"Set executable permissions on {alerter_exe}")
-        except Exception as e:
-            log.error(f"Could not set executable permissions: {e}")
-        
-        # Remove quarantine attributes - be more thorough
-        try:
-            # Remove quarantine from the entire app bundle
-            subprocess.run(['xattr', '-dr', 'com.apple.quarantine', str(app_path)],
-                          check=False, capture_output=True)
-            
-            # Also directly remove from the executable itself
-            subprocess.run(['xattr', '-d', 'com.apple.quarantine', str(alerter_exe)],
-                         check=False, capture_output=True)
-                         
-            # Remove all extended attributes to be thorough
-            subprocess.run(['xattr', '-cr', str(app_path)],
-                         check=False, capture_output=True)
-                         
-            # Remove any potential ACLs
-            subprocess.run(['chmod', '-R', '-N', str(app_path)],
-                         check=False, capture_output=True)
-                         
-            log.debug("Removed quarantine attributes and extended attributes")
-        except Exception as e:
-            log.warning(f"Could not remove quarantine attributes: {e}")
-        
-        # Fix permissions on the entire bundle - be more aggressive
-        try:
-            # Make sure the bundle and all contents are readable/executable
-            subprocess.run(['chmod', '-R', '755', str(app_path)], check=False)
-            
-            # Ensure the main executable is properly set
-            subprocess.run(['chmod', '755', str(alerter_exe)], check=False)
-            
-            # Ensure the user owns the files
-            user = os.environ.get('USER', 'root')
-            subprocess.run(['chown', '-R', user, str(app_path)], check=False)
-            
-            log.debug("Set permissions on app bundle")
-        except Exception as e:
-            log.warning(f"Could not set permissions on app bundle: {e}")
-        
-        # Try to pre-authorize the app with macOS security
-        try:
-            # This basically "touches" the app, which can help with first-run issues
-            subprocess.run(['open', '-n', str(app_path), '--args', '-help'],
-                          check=False, timeout=1)
-        except subprocess.TimeoutExpired:
-            # This is expected - we just want to trigger the security dialog
-            pass
-        except Exception as e:
-            log.warning(f"Could not pre-authorize app: {e}")
-        
-        return True
-        
-    except Exception as e:
-        log.error(f"Error fixing alerter permissions: {e}")
-        return False
+# Where the alerter app bundle gets installed
+_APP_DIR = Path.home() / ".ayon" / "apps"
+_APP_PATH = _APP_DIR / "Alerter.app"
+_ALERTER_EXE = _APP_PATH / "Contents" / "MacOS" / "alerter"
 
-def _create_alerter_app_bundle(dest_dir):
-    """Create a properly structured Alerter.app bundle with proper signing."""
-    try:
-        # Clean up any existing installation first
-        app_path = dest_dir / "Alerter.app"
-        if app_path.exists():
-            log.info(f"Removing existing Alerter.app at {app_path}")
-            shutil.rmtree(app_path, ignore_errors=True)
-        
-        # Determine Mac architecture
-        is_apple_silicon = False
-        try:
-            arch = subprocess.check_output(['uname', '-m']).decode().strip()
-            log.debug(f"Detected architecture: {arch}")
-            is_apple_silicon = arch == 'arm64'
-        except Exception as e:
-            log.warning(f"Could not detect architecture, assuming Intel: {e}")
-        
-        # Source binary - either architecture-specific or universal
-        source_binary = AYON_TOASTNOTIFY_ROOT / "vendor" / "alerter" / "alerter"
-        if not source_binary.exists():
-            # Fall back to architecture-specific binaries
-            if is_apple_silicon:
-                source_binary = AYON_TOASTNOTIFY_ROOT / "vendor" / "alerter" / "alerter_arm64"
-            else:
-                source_binary = AYON_TOASTNOTIFY_ROOT / "vendor" / "alerter" / "alerter_amd64"
-        
-        # Get path to the Info.plist
-        vendor_dir = AYON_TOASTNOTIFY_ROOT / "vendor" / "alerter"
-        info_plist_source = vendor_dir / "Info.plist"
-        
-        log.debug(f"Checking source binary at: {source_binary}")
-        log.debug(f"Source binary exists: {source_binary.exists()}")
-        log.debug(f"Info.plist source exists: {info_plist_source.exists()}")
-        
-        if not source_binary.exists():
-            log.error(f"Source binary not found at {source_binary}")
-            return None
-            
-        # Create app bundle structure
-        contents_dir = app_path / "Contents"
-        macos_dir = contents_dir / "MacOS"
-        resources_dir = contents_dir / "Resources"
-        
-        # Create directories
-        for d in (app_path, contents_dir, macos_dir, resources_dir):
-            d.mkdir(parents=True, exist_ok=True)
-        
-        # Copy and set up binary
-        alerter_path = macos_dir / "alerter"
-        shutil.copy2(source_binary, alerter_path)
-        os.chmod(alerter_path, 0o755)
-        
-        # Create Info.plist - simplified logic
-        info_plist_path = contents_dir / "Info.plist"
-        if info_plist_source.exists():
-            # Just copy the fixed plist we already have
-            shutil.copy2(info_plist_source, info_plist_path)
-            log.debug(f"Copied Info.plist from {info_plist_source}")
-        else:
-            # This should rarely happen if the vendor folder is set up correctly
-            log.warning("Info.plist source not found, creating a default one")
-            with open(info_plist_path, 'w') as f:
-                f.write('''<?xml version="1.0" encoding="UTF-8"?>
+# Written when the vendored Info.plist is missing
+_DEFAULT_INFO_PLIST = b'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
@@ -184,33 +67,278 @@ def _create_alerter_app_bundle(dest_dir):
         <true/>
     </dict>
     <key>NSHumanReadableCopyright</key>
-    <string>Copyright © 2023 AYON Framework</string>
+    <string>Copyright &#169; 2023 AYON Framework</string>
     <key>NSUserNotificationAlertStyle</key>
     <string>alert</string>
 </dict>
-</plist>''')
+</plist>'''
+
+_PKGINFO = b"APPL????"
+
+# Left next to Alerter.app once its permissions were fixed, so later launches
+# can skip _fix_alerter_permissions. Bump the version to force a re-fix.
+_INSTALLED_SENTINEL = ".alerter_installed_v1"
+# Left next to Alerter.app once the bundle was launched to pre-authorize it
+_PREAUTH_SENTINEL = ".alerter_preauth"
+# For helper commands whose output is never looked at
+_QUIET = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+
+def _clone_file(source, dest):
+    """Copy the contents of source to dest, as an APFS clone when possible.
+
+    `cp -c` uses clonefile(2), so no file data is copied. Falls back to
+    shutil.copyfile on other filesystems or if cp fails. Metadata and
+    extended attributes are not copied, the bundle sets its own.
+    """
+    try:
+        _run_quiet(['cp', '-c', '-X', str(source), str(dest)], check=True)
+        return
+    except Exception as e:
+        log.debug(f"Could not clone {source}, copying instead: {e}")
+    shutil.copyfile(source, dest)
+
+def _spawn_quiet(argv):
+    """Start a helper command with all of its standard streams on DEVNULL."""
+    return subprocess.Popen(argv, **_QUIET)
+
+def _run_quiet(argv, check=False):
+    """Run a helper command whose output is never looked at."""
+    return subprocess.run(argv, check=check, **_QUIET)
+
+def _clear_xattrs_and_chmod(path):
+    """Remove all extended attributes and set mode 755 on the whole tree.
+
+    The two don't depend on each other, so the tree is chmod'ed while
+    xattr runs.
+    """
+    xattr_proc = _spawn_quiet(['xattr', '-cr', str(path)])
+    try:
+        _chmod_tree(path)
+    finally:
+        xattr_proc.wait()
+
+def _chmod_tree(path, mode=0o755):
+    """Set mode on path and everything below it, like `chmod -R`."""
+    os.chmod(path, mode)
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            os.chmod(os.path.join(root, name), mode)
+
+def _is_executable(path):
+    """Return True if path exists and has any of its exec bits set."""
+    try:
+        return bool(os.stat(path).st_mode & 0o111)
+    except FileNotFoundError:
+        return False
+
+@contextlib.contextmanager
+def _install_file_lock(app_dir):
+    """Hold an exclusive lock on app_dir/.install.lock across processes."""
+    if fcntl is None:
+        yield
+        return
+    
+    fd = os.open(app_dir / ".install.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            log.debug("Waiting for another process to finish installing alerter")
+            # Poll instead of blocking in flock, a stuck process must not
+            # hang this one (and with it the tray shutdown) forever
+            deadline = time.monotonic() + _INSTALL_WAIT_TIMEOUT
+            while True:
+                time.sleep(0.5)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError("Timed out waiting for another process to install alerter")
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _fix_alerter_permissions(app_path, alerter_st=None):
+    """Fix permissions and security settings for the alerter app bundle.
+
+    Args:
+        app_path: Path to Alerter.app
+        alerter_st: os.stat result of the alerter executable, if the caller
+            already has one. The existence checks are skipped in that case.
+    """
+    try:
+        alerter_exe = app_path / "Contents" / "MacOS" / "alerter"
+        
+        if alerter_st is None:
+            # The executable existing implies the bundle does, one stat
+            # covers both
+            try:
+                os.stat(alerter_exe)
+            except FileNotFoundError:
+                log.error(f"Cannot fix permissions: Executable not found at {alerter_exe}")
+                return False
+        
+        # Clear extended attributes (this includes the quarantine flag) and
+        # fix the permissions of the whole bundle, the executable included.
+        # The bundle was created by this user, so neither ACLs nor ownership
+        # need fixing.
+        try:
+            _clear_xattrs_and_chmod(app_path)
+            log.debug("Removed extended attributes and set permissions on app bundle")
+        except Exception as e:
+            log.warning(f"Could not fix permissions on app bundle: {e}")
+        
+        # Try to pre-authorize the app with macOS security, once per bundle
+        preauth_sentinel = app_path.parent / _PREAUTH_SENTINEL
+        if not preauth_sentinel.exists():
+            try:
+                # This basically "touches" the app, which can help with first-run
+                # issues. Launch it hidden in the background and don't wait for it.
+                _spawn_quiet(['open', '-g', '-j', '-n', str(app_path), '--args', '-help'])
+                preauth_sentinel.touch()
+            except Exception as e:
+                log.warning(f"Could not pre-authorize app: {e}")
+        
+        return True
+        
+    except Exception as e:
+        log.error(f"Error fixing alerter permissions: {e}")
+        return False
+
+def _build_alerter_app_bundle(build_path, source_binary, info_plist_source):
+    """Populate, permission and sign an Alerter.app bundle at build_path."""
+    # Create app bundle structure
+    contents_dir = build_path / "Contents"
+    macos_dir = contents_dir / "MacOS"
+    resources_dir = contents_dir / "Resources"
+
+    # Create directories, contents_dir is created as a parent
+    macos_dir.mkdir(parents=True, exist_ok=True)
+    resources_dir.mkdir(exist_ok=True)
+
+    # Copy and set up binary
+    alerter_path = macos_dir / "alerter"
+    _clone_file(source_binary, alerter_path)
+    os.chmod(alerter_path, 0o755)
+
+    # Create Info.plist - simplified logic
+    info_plist_path = contents_dir / "Info.plist"
+    if info_plist_source.exists():
+        # Just copy the fixed plist we already have
+        shutil.copyfile(info_plist_source, info_plist_path)
+        log.debug(f"Copied Info.plist from {info_plist_source}")
+    else:
+        # This should rarely happen if the vendor folder is set up correctly
+        log.warning("Info.plist source not found, creating a default one")
+        info_plist_path.write_bytes(_DEFAULT_INFO_PLIST)
+
+    # Create PkgInfo
+    (contents_dir / "PkgInfo").write_bytes(_PKGINFO)
+
+    # Remove all extended attributes (the quarantine flag included) and fix
+    # permissions on the entire bundle, both must be done before signing
+    log.debug("Removing extended attributes and setting permissions on app bundle")
+    _clear_xattrs_and_chmod(build_path)
+
+    # Try to sign the app with ad-hoc signature. The bundle has no nested
+    # code, so --deep is not needed
+    log.debug("Attempting to ad-hoc sign the app")
+    try:
+        result = subprocess.run(
+            ['codesign', '--force', '--sign', '-', str(build_path)],
+            check=False, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, bufsize=-1
+        )
+        if result.returncode == 0:
+            log.debug("Ad-hoc signing completed")
+        else:
+            log.warning(f"Ad-hoc signing failed: {result.stderr.decode(errors='replace').strip()}")
+    except Exception as e:
+        log.warning(f"Could not sign app bundle (will still try to use it): {e}")
+
+def _remove_stale_build_dirs(dest_dir):
+    """Remove .Alerter.*.app and .Alerter.old.* left by interrupted installs.
+
+    They are complete app bundles with the same bundle identifier, which
+    LaunchServices could register as more copies of the app. Only called
+    under the install file lock, so no other install is using them.
+    """
+    # A swap that failed halfway leaves the previous bundle aside, put it
+    # back rather than delete the only copy
+    app_path = dest_dir / "Alerter.app"
+    if not app_path.exists():
+        for old_app in dest_dir.glob(".Alerter.old.*/Alerter.app"):
+            log.info(f"Restoring previous Alerter.app from {old_app}")
+            try:
+                os.replace(old_app, app_path)
+                break
+            except OSError as e:
+                log.debug(f"Could not restore {old_app}: {e}")
+    
+    for path in dest_dir.glob(".Alerter.*"):
+        log.debug(f"Removing leftover {path}")
+        shutil.rmtree(path, ignore_errors=True)
+
+def _create_alerter_app_bundle(dest_dir):
+    """Create a properly structured Alerter.app bundle with proper signing."""
+    try:
+        app_path = dest_dir / "Alerter.app"
+        vendor_dir = AYON_TOASTNOTIFY_ROOT / "vendor" / "alerter"
+        
+        # Source binary - either architecture-specific or universal
+        source_binary = vendor_dir / "alerter"
+        if not source_binary.exists():
+            # Fall back to architecture-specific binaries
+            if _IS_ARM64:
+                source_binary = vendor_dir / "alerter_arm64"
+            else:
+                source_binary = vendor_dir / "alerter_amd64"
         
-        # Create PkgInfo
-        with open(contents_dir / "PkgInfo", 'w') as f:
-            f.write("APPL????")
+        # Get path to the Info.plist
+        info_plist_source = vendor_dir / "Info.plist"
         
-        # Fix permissions on the entire bundle
-        log.debug("Setting permissions on app bundle")
-        subprocess.run(['chmod', '-R', '755', str(app_path)], check=False)
+        log.debug(f"Checking source binary at: {source_binary}")
+        log.debug(f"Source binary exists: {source_binary.exists()}")
+        log.debug(f"Info.plist source exists: {info_plist_source.exists()}")
+        
+        if not source_binary.exists():
+            log.error(f"Source binary not found at {source_binary}")
+            return None
         
-        # Remove quarantine attributes
-        log.debug("Removing quarantine attributes")
-        subprocess.run(['xattr', '-rd', 'com.apple.quarantine', str(app_path)], check=False)
-        subprocess.run(['xattr', '-rc', str(app_path)], check=False)
+        alerter_path = app_path / "Contents" / "MacOS" / "alerter"
         
-        # Try to sign the app with ad-hoc signature
-        log.debug("Attempting to ad-hoc sign the app")
+        # Build the new bundle next to the existing one and swap it in at the
+        # end, so Alerter.app is never half-written on disk. It is only
+        # missing between the two renames of the swap.
+        _remove_stale_build_dirs(dest_dir)
+        build_path = Path(tempfile.mkdtemp(prefix=".Alerter.", suffix=".app", dir=dest_dir))
         try:
-            subprocess.run(['codesign', '--force', '--deep', '--sign', '-', str(app_path)], 
-                          check=False, capture_output=True)
-            log.debug("Ad-hoc signing completed")
-        except Exception as e:
-            log.warning(f"Could not sign app bundle (will still try to use it): {e}")
+            _build_alerter_app_bundle(build_path, source_binary, info_plist_source)
+            
+            if app_path.exists():
+                log.info(f"Replacing existing Alerter.app at {app_path}")
+                old_path = Path(tempfile.mkdtemp(prefix=".Alerter.old.", dir=dest_dir))
+                os.replace(app_path, old_path / "Alerter.app")
+                try:
+                    os.replace(build_path, app_path)
+                except OSError:
+                    # Put the previous bundle back instead of leaving none
+                    os.replace(old_path / "Alerter.app", app_path)
+                    raise
+                finally:
+                    # If putting it back failed too, old_path holds the only
+                    # copy, it is kept
+                    if app_path.exists():
+                        shutil.rmtree(old_path, ignore_errors=True)
+            else:
+                os.replace(build_path, app_path)
+        finally:
+            if build_path.exists():
+                shutil.rmtree(build_path, ignore_errors=True)
         
         log.info(f"Successfully created alerter app bundle at {alerter_path}")
         return alerter_path
@@ -221,148 +349,250 @@ def _create_alerter_app_bundle(dest_dir):
 
 def _ensure_alerter_available(force_reinstall=False):
     """Ensure alerter is available as a properly structured app bundle."""
-    global _installation_completed, _installation_result, _installation_in_progress
-    
     # Skip if not on macOS
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return None
     
-    # Force reinstall if requested
-    if force_reinstall:
-        _installation_completed = False
-        _installation_result = None
-    
-    # Check if installation is already completed
-    with _installation_lock:
-        if _installation_completed and not force_reinstall:
-            return _installation_result
+    with _installation_cond:
+        # Only one thread installs at a time, the others wait for it and
+        # share its result
+        while _install_state["in_progress"]:
+            _installation_cond.wait()
+        
+        # Force reinstall if requested
+        if force_reinstall:
+            _install_state.update(completed=False, result=None)
+        
+        # Check if installation is already completed
+        if _install_state["completed"]:
+            return _install_state["result"]
+        
+        _install_state["in_progress"] = True
     
+    try:
+        return _install_alerter_bundle(force_reinstall)
+    except TimeoutError as e:
+        # Not recorded as completed, the next call tries again
+        log.warning(str(e))
+        return None
+    except OSError as e:
+        # E.g. the app directory or the lock file can't be created. Not
+        # recorded as completed either, callers just get no alerter.
+        log.error(f"Error in alerter installation: {e}")
+        return None
+    finally:
+        with _installation_cond:
+            _install_state["in_progress"] = False
+            _installation_cond.notify_all()
+
+def _install_alerter_bundle(force_reinstall):
+    """Find, fix or create the alerter app bundle and record the result.
+
+    Only called by _ensure_alerter_available, which makes sure a single
+    thread runs it at a time.
+    """
     # Look for existing installation
-    app_dir = Path.home() / ".ayon" / "apps"
-    app_path = app_dir / "Alerter.app"
-    alerter_exe = app_path / "Contents" / "MacOS" / "alerter"
+    app_dir = _APP_DIR
+    app_path = _APP_PATH
+    alerter_exe = _ALERTER_EXE
     
+    # A single stat answers both "exists" and "is executable"
+    try:
+        alerter_st = os.stat(alerter_exe)
+    except FileNotFoundError:
+        alerter_st = None
+
     # If it exists and is executable, use it (unless force_reinstall)
-    if not force_reinstall and alerter_exe.exists() and os.access(alerter_exe, os.X_OK):
+    if not force_reinstall and alerter_st is not None and alerter_st.st_mode & 0o111:
         log.debug(f"Found existing alerter app bundle at {alerter_exe}")
         
-        # Fix permissions if needed
-        _fix_alerter_permissions(app_path)
+        # Fix permissions if needed, a previous launch leaves a sentinel
+        # once that has been done for this bundle. An executable newer than
+        # the sentinel was replaced since, so fix it again.
+        sentinel = app_dir / _INSTALLED_SENTINEL
+        try:
+            fixed = os.stat(sentinel).st_mtime >= alerter_st.st_mtime
+        except FileNotFoundError:
+            fixed = False
+        if fixed:
+            log.debug("Alerter permissions already fixed, skipping")
+        elif _fix_alerter_permissions(app_path, alerter_st=alerter_st):
+            try:
+                sentinel.touch()
+            except OSError as e:
+                log.debug(f"Could not write {sentinel}: {e}")
         
         with _installation_lock:
-            _installation_completed = True
-            _installation_result = str(alerter_exe)
+            _install_state.update(completed=True, result=str(alerter_exe))
         return str(alerter_exe)
     
     # Create app directory if it doesn't exist
     app_dir.mkdir(parents=True, exist_ok=True)
     
-    # If path exists but we're reinstalling, remove it
-    if app_path.exists():
-        log.debug(f"Removing existing app bundle for reinstallation at {app_path}")
-        try:
-            shutil.rmtree(app_path)
-        except Exception as e:
-            log.error(f"Failed to remove existing app bundle: {e}")
-    
-    # Create the app bundle
-    with _installation_lock:
-        _installation_in_progress = True
-    
-    try:
-        alerter_exe = _create_alerter_app_bundle(app_dir)
-        
-        if alerter_exe:
-            log.info(f"Successfully installed alerter at {alerter_exe}")
+    # Several AYON processes (tray, DCC launchers) may start at the same
+    # time, only one of them may rebuild the bundle
+    with _install_file_lock(app_dir):
+        # Another process may have finished the installation while we waited.
+        # A bundle that exists but isn't executable gets its permissions
+        # fixed, and is rebuilt below if that doesn't help.
+        if not force_reinstall and _is_executable(alerter_exe):
+            log.debug(f"Alerter was installed by another process at {alerter_exe}")
             with _installation_lock:
-                _installation_completed = True
-                _installation_result = str(alerter_exe)
-                _installation_in_progress = False
+                _install_state.update(completed=True, result=str(alerter_exe))
             return str(alerter_exe)
-        else:
-            log.error("Failed to create alerter app bundle")
+        if (
+            not force_reinstall
+            and alerter_exe.exists()
+            and _fix_alerter_permissions(app_path)
+            and _is_executable(alerter_exe)
+        ):
+            log.info(f"Fixed permissions of existing alerter at {alerter_exe}")
+            sentinel = app_dir / _INSTALLED_SENTINEL
+            try:
+                sentinel.touch()
+            except OSError as e:
+                log.debug(f"Could not write {sentinel}: {e}")
             with _installation_lock:
-                _installation_completed = True
-                _installation_result = None
-                _installation_in_progress = False
+                _install_state.update(completed=True, result=str(alerter_exe))
+            return str(alerter_exe)
+
+        # The bundle needs its permissions fixed and to be pre-authorized
+        # again on the next launch
+        (app_dir / _INSTALLED_SENTINEL).unlink(missing_ok=True)
+        (app_dir / _PREAUTH_SENTINEL).unlink(missing_ok=True)
+        
+        # Create the app bundle, replacing a missing, broken or (on a forced
+        # reinstall) existing one
+        try:
+            alerter_exe = _create_alerter_app_bundle(app_dir)
+            
+            if alerter_exe:
+                log.info(f"Successfully installed alerter at {alerter_exe}")
+                with _installation_lock:
+                    _install_state.update(completed=True, result=str(alerter_exe))
+                return str(alerter_exe)
+            else:
+                log.error("Failed to create alerter app bundle")
+                with _installation_lock:
+                    _install_state.update(completed=True, result=None)
+                return None
+        except Exception as e:
+            log.error(f"Error in alerter installation: {e}")
             return None
-    except Exception as e:
-        log.error(f"Error in alerter installation: {e}")
-        with _installation_lock:
-            _installation_in_progress = False
-        return None
+
+def get_alerter_install_future():
+    """Return the Future of the background alerter installation.
+
+    Returns:
+        concurrent.futures.Future | None: None if no background
+            installation was started yet.
+    """
+    with _installation_lock:
+        return _install_future
+
+def _start_background_install():
+    """Run _ensure_alerter_available on a daemon thread and return its Future.
+
+    Unlike an executor worker, a daemon thread doesn't keep the interpreter
+    from exiting while an installation is still running.
+    """
+    future = concurrent.futures.Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_ensure_alerter_available(False))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name="alerter-install", daemon=True).start()
+    return future
+
+def _submit_install():
+    """Start the background installation unless one is running or succeeded.
+
+    A finished installation that failed is submitted again.
+    """
+    global _install_future
+    
+    with _installation_lock:
+        if (
+            _install_future is None
+            or (_install_future.done() and (
+                _install_future.exception() is not None
+                or not _install_future.result()
+            ))
+        ):
+            _install_future = _start_background_install()
+        return _install_future
 
 def install_alerter(settings, async_install=True):
     """Install the alerter app bundle for macOS notifications."""
-    global _installation_in_progress
-    
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return None
     
-    if _installation_in_progress:
-        log.debug("Alerter installation already in progress, skipping")
+    if async_install:
+        # Only ever run one background install, later calls get the result
+        # of the finished installation (or None while it is still running).
+        # Callers that need to wait can use get_alerter_install_future().
+        future = _submit_install()
+        if future.done() and future.exception() is None:
+            return future.result()
+        log.debug("Alerter installation running in the background")
         return None
     
+    # Wait for a background installation instead of starting another one
+    future = get_alerter_install_future()
+    if future is not None and not future.done():
+        log.debug("Alerter installation already in progress, waiting for it")
+        try:
+            return future.result(timeout=_INSTALL_WAIT_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            log.warning("Timed out waiting for the alerter installation")
+            return None
+        except Exception as e:
+            log.error(f"Error in alerter installation: {e}")
+            return None
+    
     # Check if we should show installation warnings
     show_warnings = False
     if settings and isinstance(settings, dict):
         show_warnings = settings.get("alerter_installation_warnings_on_each_launch", False)
     
-    if async_install:
-        # Install in a separate thread to not block startup
-        threading.Thread(
-            target=_ensure_alerter_available,
-            args=(False,),
-            daemon=True
-        ).start()
-        return None
-    else:
-        # Install synchronously
-        result = _ensure_alerter_available(False)
-        
-        # After successful installation, prompt for notification settings
-        # Only show prompt if installation succeeded AND warnings are enabled
-        if not async_install and result and os.path.exists(result) and show_warnings:
-            # Use QTimer to ensure this runs on the main thread with a slight delay
-            QtCore.QTimer.singleShot(100, prompt_notification_settings)
-        
-        return result
+    # Install synchronously
+    result = _ensure_alerter_available(False)
+    
+    # After successful installation, prompt for notification settings
+    # Only show prompt if installation succeeded AND warnings are enabled
+    if result and os.path.exists(result) and show_warnings:
+        # Use QTimer to ensure this runs on the main thread with a slight delay
+        from qtpy import QtCore
+        QtCore.QTimer.singleShot(100, prompt_notification_settings)
+    
+    return result
     
 def force_reinstall_alerter():
     """Force reinstallation of alerter app bundle."""
-    global _installation_completed, _installation_result, _installation_in_progress
-    
     log.info("Forcing reinstallation of alerter")
     
     # Reset installation status
     with _installation_lock:
-        _installation_completed = False
-        _installation_result = None
-        _installation_in_progress = False
-    
-    # Delete existing installation
-    app_dir = Path.home() / ".ayon" / "apps"
-    app_path = app_dir / "Alerter.app"
-    
-    if app_path.exists():
-        try:
-            shutil.rmtree(app_path)
-            log.info(f"Removed existing Alerter.app at {app_path}")
-        except Exception as e:
-            log.error(f"Error removing existing installation: {e}")
+        _install_state.update(completed=False, result=None)
     
-    # Run the installation
+    # Run the installation, this always rebuilds the bundle
     return _ensure_alerter_available(force_reinstall=True)
 
 def open_notification_settings():
     """Open the macOS notification settings panel."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         log.warning("This function is only applicable on macOS")
         return False
     
     try:
-        # Open the Notifications preference pane
-        subprocess.run([
+        # Open the Notifications preference pane, don't wait for `open` so
+        # the follow-up instructions show up right away
+        _spawn_quiet([
             "open", "x-apple.systempreferences:com.apple.preference.notifications"
         ])
         log.info("Opened notification settings panel")
@@ -373,31 +603,24 @@ def open_notification_settings():
 
 def prompt_notification_settings():
     """Show QtPy dialog prompting user to enable notifications for Alerter."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         log.warning("This function is only applicable on macOS")
         return False
+    
+    # Qt is only needed for this dialog, don't import it with the module
+    from qtpy import QtWidgets, QtCore
         
     try:
         # Check if alerter is actually installed before proceeding
-        app_path = Path.home() / ".ayon" / "apps" / "Alerter.app"
-        alerter_exe = app_path / "Contents" / "MacOS" / "alerter"
+        alerter_exe = _ALERTER_EXE
         
-        # Create a parent widget to ensure the dialog doesn't cause app closure
-        # Get active window if possible
+        # Use the active window as parent if there is one, otherwise the
+        # message box is shown as a top-level dialog
         parent = None
         try:
             parent = QtWidgets.QApplication.activeWindow()
         except:
             pass
-        
-        # If no active window, create a temporary widget to serve as parent
-        if parent is None:
-            parent = QtWidgets.QWidget()
-            parent.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint)
-            parent.resize(1, 1)
-            parent.show()
-            # Hide it immediately but keep it alive
-            parent.setVisible(False)
             
         if not alerter_exe.exists():
             # Alerter failed to install, show different message
@@ -417,9 +640,6 @@ def prompt_notification_settings():
             # Make sure dialog is modal to prevent application from quitting
             msg_box.setModal(True)
             
-            # Process events before showing dialog
-            QtWidgets.QApplication.processEvents()
-            
             # Use exec_ to ensure application doesn't exit (Qt5 compatible)
             msg_box.exec_()
             
@@ -428,10 +648,6 @@ def prompt_notification_settings():
                 # Force reinstall alerter on a timer to avoid blocking
                 QtCore.QTimer.singleShot(100, force_reinstall_alerter)
                 
-            # Clean up temporary parent if we created one
-            if parent and not parent.isVisible():
-                parent.deleteLater()
-                
             return False
             
         # If we get here, alerter is installed, so open notification settings
@@ -457,16 +673,9 @@ def prompt_notification_settings():
         # Make sure dialog is modal
         msg_box.setModal(True)
         
-        # Process events before showing dialog
-        QtWidgets.QApplication.processEvents()
-        
         # Use exec_ to ensure application doesn't exit (Qt5 compatible)
         msg_box.exec_()
         
-        # Clean up temporary parent if we created one
-        if parent and not parent.isVisible():
-            parent.deleteLater()
-            
         return True
  
     except Exception as e:
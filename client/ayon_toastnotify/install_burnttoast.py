@@ -1,30 +1,337 @@
 import os
+import concurrent.futures
+import logging
+import shutil
+import hashlib
 import platform
+import secrets
 import subprocess
 import tempfile
+import textwrap
 import zipfile
+import zlib
 import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from . import AYON_TOASTNOTIFY_ROOT
 from .logger import log
 
-# Module-level flags to track installation status
-_installation_in_progress = False
-_installation_completed = False
-_installation_result = False
+@dataclass
+class _InstallState:
+    """Installation status, in_progress is only changed under the lock.
+
+    completed is set once the result is final, so it can be checked
+    without taking the lock.
+    """
+    in_progress: bool = False
+    completed: threading.Event = field(default_factory=threading.Event)
+    result: bool = False
+
+_state = _InstallState()
 _installation_lock = threading.Lock()
 
-def _create_hidden_startupinfo():
-    """Create startupinfo object to hide console window"""
-    if platform.system() != "Windows":
-        return None
+# Copy buffer for extracting the bundled module, the default 16 KiB means
+# a lot of small writes for the ~27 MB SDK dll
+_EXTRACT_BUFSIZE = 1 << 20
+
+# Written into the module directory after a successful extraction, holds
+# the mtime and size of the ZIP file it was extracted from
+_BUNDLE_SIG_FILE = ".ayon_bt_sig"
+# Same, but with the BLAKE2b hash of the ZIP. Checked when the signature
+# differs, e.g. after the addon was deployed again with the same ZIP
+_BUNDLE_HASH_FILE = ".ayon_bt_hash"
+
+# Staging and old module directories younger than this may still be in use
+# by an install running in another process, they are not swept
+_STALE_DIR_AGE = 600
+
+def _remove_stale_module_dirs(modules_dir):
+    """Remove BurntToast.new.* and BurntToast.old.* left by earlier installs.
+
+    Their removal runs on a daemon thread, so an exit right after an
+    install leaves them behind.
+    """
+    now = time.time()
+    # Ours can't be in use, they are left from an earlier process that had
+    # the same pid
+    own_suffix = f".{os.getpid()}"
+    for pattern in ("BurntToast.new.*", "BurntToast.old.*"):
+        for path in modules_dir.glob(pattern):
+            try:
+                recent = now - path.stat().st_mtime < _STALE_DIR_AGE
+            except OSError:
+                continue
+            if recent and not path.name.endswith(own_suffix):
+                continue
+            log.debug(f"Removing leftover {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+# Installs BurntToast from the PowerShell Gallery, with aggressive error
+# handling
+_PS_INSTALL_SCRIPT = textwrap.dedent("""
+        # Set error preferences
+        $ErrorActionPreference = "Continue"
+        $ProgressPreference = "SilentlyContinue"
+        
+        # Trust the PSGallery
+        try {
+            Set-PSRepository -Name "PSGallery" -InstallationPolicy Trusted -ErrorAction SilentlyContinue
+        } catch {
+            Write-Output "Warning: Could not set PSGallery to trusted: $_"
+        }
+        
+        # Force TLS 1.2 for gallery connections
+        [Net.ServicePointManager]::SecurityProtocol = [Net.ServicePointManager]::SecurityProtocol -bor [Net.SecurityProtocolType]::Tls12
+        
+        try {
+            # Check if module is already installed
+            if (Get-Module -ListAvailable -Name BurntToast) {
+                Write-Output "BurntToast module is already installed"
+                exit 0
+            }
+            
+            # Create target directory
+            $moduleDir = "$HOME\\Documents\\WindowsPowerShell\\Modules\\BurntToast"
+            if (-not (Test-Path $moduleDir)) {
+                New-Item -Path $moduleDir -ItemType Directory -Force | Out-Null
+                Write-Output "Created directory: $moduleDir"
+            }
+            
+            # Install BurntToast
+            Write-Output "Installing BurntToast module..."
+            Install-Module -Name BurntToast -Scope CurrentUser -Force -AllowClobber -Verbose
+            
+            # Verify installation
+            if (Get-Module -ListAvailable -Name BurntToast) {
+                Write-Output "BurntToast module installed successfully"
+                exit 0
+            } else {
+                Write-Output "BurntToast module installation failed"
+                exit 1
+            }
+        } catch {
+            Write-Output "Error installing BurntToast: $_"
+            exit 1
+        }
+        """).strip()
+
+# Loads the module and keeps it loaded. It must not call exit, that would
+# end the persistent PowerShell host it is run in. The host imported the
+# module already, so it is not imported again with -Force
+_PS_WARMUP_SCRIPT = textwrap.dedent("""
+        $ProgressPreference = "SilentlyContinue"
+        
+        # Check if module is available
+        $moduleAvailable = Get-Module -ListAvailable BurntToast
+        if (-not $moduleAvailable) {
+            Write-Output "BurntToast module is not available"
+            throw "BurntToast module is not available"
+        }
+        
+        # Load the module and preload classes
+        Import-Module BurntToast -DisableNameChecking
+        
+        # Pre-load some .NET classes
+        $null = [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime]
+        $null = [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime]
+        
+        # Load the AppID
+        New-BTAppId -AppId "AYON.ToastNotify" -AppDisplayName "AYON ToastNotify" -ErrorAction SilentlyContinue
         
-    startupinfo = subprocess.STARTUPINFO()
-    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    startupinfo.wShowWindow = 0  # SW_HIDE
-    return startupinfo
+        Write-Output "Warmup completed successfully"
+        """).strip()
+
+def _warmup_ps_with_marker(marker):
+    """Return the warm-up script for a one-shot PowerShell.
+
+    It reports success by writing the marker file instead of its output,
+    so its stdio doesn't need to be captured. The marker path is unique per
+    call, concurrent AYON processes must not see each other's marker.
+    """
+    literal = str(marker).replace("'", "''")
+    return _PS_WARMUP_SCRIPT + f"\n'ok' | Out-File -Encoding ASCII -LiteralPath '{literal}'\n"
+
+def _archive_member_path(dest, name):
+    """Return where an archive member gets extracted to below dest.
+
+    The bundled archive was created on Windows and uses backslashes as
+    separators, normalize them and refuse anything outside dest.
+    """
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or ":" in parts[0]:
+        raise ValueError(f"Unsafe path in archive: {name}")
+    return dest.joinpath(*parts)
+
+def _file_crc32(path):
+    """Return the CRC-32 of the file at path, as stored in ZIP headers."""
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_EXTRACT_BUFSIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+def _is_extracted(info, target):
+    """Check whether target already holds the content of ZIP member info."""
+    try:
+        if os.stat(target).st_size != info.file_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return _file_crc32(target) == info.CRC
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying it where links are not supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _extract_zip(zf, dest):
+    """Extract all members of zf to dest, copying with a large buffer.
+
+    Files in dest that already match their member's size and CRC are left
+    alone, files that are not part of the archive are removed. Members are
+    extracted in parallel, zlib releases the GIL while inflating.
+
+    Returns:
+        int: Number of files written.
+    """
+    expected = set()
+    members = []
+    # Create the directories up front so the workers only write files
+    for info in zf.infolist():
+        target = _archive_member_path(dest, info.filename)
+        expected.add(target)
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            members.append((info, target))
+    
+    # Reading members of one ZipFile from several threads is not safe, each
+    # worker opens the archive itself
+    local = threading.local()
+    opened = []
+    
+    def extract_member(member):
+        info, target = member
+        if _is_extracted(info, target):
+            return 0
+        worker_zf = getattr(local, "zf", None)
+        if worker_zf is None:
+            worker_zf = local.zf = zipfile.ZipFile(zf.filename)
+            opened.append(worker_zf)
+        # The target may be hardlinked to the installed module, replace
+        # it rather than writing through the link
+        target.unlink(missing_ok=True)
+        with worker_zf.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _EXTRACT_BUFSIZE)
+        return 1
+    
+    written = 0
+    if members:
+        workers = min(len(members), os.cpu_count() or 1)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                written = sum(executor.map(extract_member, members))
+        finally:
+            for worker_zf in opened:
+                worker_zf.close()
+    
+    _remove_stale_files(dest, expected)
+    return written
+
+def _remove_stale_files(dest, expected):
+    """Remove files below dest that are not in expected, e.g. leftovers of
+    a previous BurntToast version.
+    """
+    for root, _dirs, files in os.walk(dest):
+        for name in files:
+            path = Path(root, name)
+            # Keep our own install signature files
+            if path in expected or name.startswith(".ayon_bt_"):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                log.debug(f"Could not remove stale file {path}: {e}")
+
+def _file_digest(path):
+    """Return the BLAKE2b hex digest of the file at path."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "blake2b").hexdigest()
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(_EXTRACT_BUFSIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _find_psd1(root):
+    """Return the shallowest .psd1 module manifest below root, or None.
+
+    Walks the tree breadth first with os.scandir, so a manifest directly in
+    root is found without looking into any subdirectory.
+    """
+    pending = [root]
+    while pending:
+        subdirs = []
+        for directory in pending:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".psd1"):
+                        return Path(entry.path)
+        pending = subdirs
+    return None
+
+def _extract_bundle(bundled_zip, dest):
+    """Extract the bundled module archive to dest and flatten a nested
+    BurntToast directory.
+
+    Returns:
+        Path: The module manifest, None if the archive holds no BurntToast
+            module.
+    """
+    # Extract with clear debug output, only changed files are written
+    log.info(f"Extracting {bundled_zip.name} to {dest}")
+    with zipfile.ZipFile(bundled_zip) as zf:
+        written = _extract_zip(zf, dest)
+    log.debug(f"Wrote {written} changed files to {dest}")
+
+    # Verify extraction worked, the shallowest manifest is found first
+    manifest = _find_psd1(dest)
+    if manifest is not None and manifest.parent != dest:
+        log.warning("No .psd1 files found in extracted directory")
+
+        # Check for nested dirs and fix if needed
+        nested_module = manifest.parent
+        if manifest.name == "BurntToast.psd1":
+            log.info(f"Found nested module at {nested_module}")
+            # Move files from nested dir to module root, it is on the
+            # same filesystem so this is a rename per item
+            for item in list(nested_module.iterdir()):
+                target = dest / item.name
+                if target == nested_module or target in nested_module.parents:
+                    # Would replace the directory we are moving from
+                    log.warning(f"Can't move {item} to {target}, skipping")
+                    continue
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target)
+                elif target.exists():
+                    target.unlink()
+                os.replace(item, target)
+            try:
+                nested_module.rmdir()
+            except OSError:
+                pass
+            manifest = dest / manifest.name
+            log.debug(f"Fixed directory structure: {manifest}")
+        else:
+            manifest = None
+    return manifest
 
 def _install_from_bundled_zip(powershell_path):
     """Install BurntToast from bundled ZIP file."""
@@ -36,67 +343,103 @@ def _install_from_bundled_zip(powershell_path):
         module_path = Path(os.path.expanduser("~")) / "Documents" / "WindowsPowerShell" / "Modules" / "BurntToast"
         
  
-        log.debug(f"AYON_TOASTNOTIFY_ROOT: {AYON_TOASTNOTIFY_ROOT}")
-        log.debug(f"Target module path: {module_path}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"AYON_TOASTNOTIFY_ROOT: {AYON_TOASTNOTIFY_ROOT}")
+            log.debug(f"Target module path: {module_path}")
         
         # Check if ZIP exists
         if not bundled_zip.exists():
             log.error(f"BurntToast.zip not found at {bundled_zip}")
  
             vendor_dir = AYON_TOASTNOTIFY_ROOT / "vendor"
-            if vendor_dir.exists():
-                log.debug(f"Vendor directory contents: {list(vendor_dir.glob('*'))}")
-            else:
+            if not vendor_dir.exists():
                 log.error("Vendor directory doesn't exist")
+            elif log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Vendor directory contents: {list(vendor_dir.glob('*'))}")
             return False
         
         log.info(f"Found BurntToast.zip at {bundled_zip}")
-        log.debug(f"ZIP file size: {bundled_zip.stat().st_size} bytes")
+        zip_st = bundled_zip.stat()
+        log.debug(f"ZIP file size: {zip_st.st_size} bytes")
+        
+        # Skip the extraction if this exact ZIP was extracted before
+        signature = f"{zip_st.st_mtime_ns}:{zip_st.st_size}"
+        sig_file = module_path / _BUNDLE_SIG_FILE
+        hash_file = module_path / _BUNDLE_HASH_FILE
+        zip_hash = None
+        if (module_path / "BurntToast.psd1").exists():
+            try:
+                if sig_file.read_text() == signature:
+                    log.info(f"BurntToast module already installed from this ZIP at {module_path}")
+                    return True
+            except OSError:
+                pass
+            
+            # Only hash the ZIP when the cheap signature check fails
+            try:
+                zip_hash = _file_digest(bundled_zip)
+                if hash_file.read_text() == zip_hash:
+                    log.info(f"BurntToast module already installed from an identical ZIP at {module_path}")
+                    sig_file.write_text(signature)
+                    return True
+            except OSError:
+                pass
         
         try:
-            import shutil
-            
             # Create module directory path if needed
             module_path.parent.mkdir(parents=True, exist_ok=True)
+            _remove_stale_module_dirs(module_path.parent)
             
-            # Remove existing module dir if present
+            # Extract next to the module and swap the directories once the
+            # extraction is complete, so a crash mid-extract leaves the
+            # installed module untouched
+            staging = module_path.parent / f"BurntToast.new.{os.getpid()}"
+            if staging.exists():
+                shutil.rmtree(staging)
             if module_path.exists():
-                log.info(f"Removing existing module at {module_path}")
-                shutil.rmtree(module_path)
-            
-            # Create fresh module directory
-            module_path.mkdir(parents=True, exist_ok=True)
+                # Start from the installed files so only changed files are written
+                shutil.copytree(module_path, staging, symlinks=True, copy_function=_link_or_copy)
+            else:
+                staging.mkdir()
             
-            # Extract with clear debug output
-            log.info(f"Extracting ZIP to {module_path}")
-            with zipfile.ZipFile(bundled_zip) as zf:
-                zf.extractall(module_path)
+            manifest = _extract_bundle(bundled_zip, staging)
+            if manifest is None:
+                shutil.rmtree(staging, ignore_errors=True)
+                log.error("No .psd1 files found after extracting and fixing structure")
+                return False
             
-            # Verify extraction worked
-            if not any(module_path.glob("*.psd1")):
-                log.warning("No .psd1 files found in extracted directory")
-                nested_dirs = list(module_path.glob("**/"))
-                log.debug(f"Contents after extraction: {nested_dirs}")
-                
-                # Check for nested dirs and fix if needed
-                nested_modules = list(module_path.glob("**/BurntToast.psd1"))
-                if nested_modules:
-                    log.info(f"Found nested module at {nested_modules[0].parent}")
-                    # Move files from nested dir to module root
-                    for item in nested_modules[0].parent.glob("*"):
-                        target = module_path / item.name
-                        if item.is_dir():
-                            if target.exists():
-                                shutil.rmtree(target)
-                            shutil.copytree(item, target)
-                        else:
-                            shutil.copy2(item, target)
-                    log.debug(f"Fixed directory structure: {list(module_path.glob('*.psd1'))}")
+            old = module_path.parent / f"BurntToast.old.{os.getpid()}"
+            try:
+                if module_path.exists():
+                    os.rename(module_path, old)
+            except OSError as e:
+                # A PowerShell session holding the module's dlls keeps the
+                # directory from being renamed, update it in place instead
+                log.warning(f"Could not move {module_path} aside, updating it in place: {e}")
+                shutil.rmtree(staging, ignore_errors=True)
+                manifest = _extract_bundle(bundled_zip, module_path)
+            else:
+                try:
+                    os.rename(staging, module_path)
+                except OSError:
+                    # Put the previous module back instead of leaving none
+                    if old.exists():
+                        os.rename(old, module_path)
+                    shutil.rmtree(staging, ignore_errors=True)
+                    raise
+                manifest = module_path / manifest.name
+                threading.Thread(
+                    target=shutil.rmtree, args=(old,), kwargs={"ignore_errors": True}, daemon=True
+                ).start()
             
             # Final verification
-            manifest_files = list(module_path.glob("*.psd1"))
-            if manifest_files:
-                log.info(f"BurntToast module installed successfully: {manifest_files}")
+            if manifest is not None:
+                log.info(f"BurntToast module installed successfully: {manifest}")
+                try:
+                    sig_file.write_text(signature)
+                    hash_file.write_text(zip_hash or _file_digest(bundled_zip))
+                except OSError as e:
+                    log.debug(f"Could not write the BurntToast install signature: {e}")
                 return True
             else:
                 log.error("No .psd1 files found after extracting and fixing structure")
@@ -104,14 +447,16 @@ def _install_from_bundled_zip(powershell_path):
                 
         except Exception as zip_error:
             log.error(f"ZIP extraction error: {zip_error}")
-            import traceback
-            log.debug(traceback.format_exc())
+            if log.isEnabledFor(logging.DEBUG):
+                import traceback
+                log.debug(traceback.format_exc())
             return False
             
     except Exception as e:
         log.error(f"Error installing BurntToast from bundled ZIP: {e}")
-        import traceback
-        log.debug(traceback.format_exc())
+        if log.isEnabledFor(logging.DEBUG):
+            import traceback
+            log.debug(traceback.format_exc())
         return False
 
 def create_minimal_burnttoast_module():
@@ -241,47 +586,27 @@ def install_burnt_toast(settings, async_install=True):
     Returns:
         bool: True if BurntToast is installed or installation started successfully
     """
-    global _installation_in_progress, _installation_completed, _installation_result
-    
     # Skip if not on Windows
     if platform.system() != "Windows":
         return True
     
-    # Check if installation is already in progress or completed
+    # Check if installation is already in progress or completed, and
+    # mark it as started so the bundled zip is only extracted once
     with _installation_lock:
-        if _installation_in_progress:
+        if _state.in_progress:
             log.info("BurntToast installation already in progress")
             return True
         
-        if _installation_completed:
-            log.info(f"BurntToast installation already completed (success={_installation_result})")
-            return _installation_result
-    
-    # Check if BurntToast is already installed
-    powershell_path = settings.get("windows_powershell_path", "powershell.exe")
-    
-    # Try installing from the bundled zip first (synchronously)
-    log.info("Attempting to install BurntToast from bundled zip")
-    result = _install_from_bundled_zip(powershell_path)
-    
-    if result:
-        with _installation_lock:
-            _installation_completed = True
-            _installation_result = True
-        log.info("BurntToast installed successfully from bundled zip")
-        return True
-    
-    # If bundled installation failed, try PowerShell Gallery installation
-    log.info("Bundled installation failed, trying PowerShell Gallery installation")
-    
-    # Mark installation as started
-    with _installation_lock:
-        _installation_in_progress = True
+        if _state.completed.is_set():
+            log.info(f"BurntToast installation already completed (success={_state.result})")
+            return _state.result
+        
+        _state.in_progress = True
     
     if async_install:
         # Start installation in a background thread
         install_thread = threading.Thread(
-            target=_perform_install,
+            target=_perform_bundled_then_gallery_install,
             args=(settings,),
         )
         install_thread.daemon = True
@@ -289,80 +614,65 @@ def install_burnt_toast(settings, async_install=True):
         return True
     else:
         # Run installation synchronously
+        return _perform_bundled_then_gallery_install(settings)
+
+def _finish_install(result):
+    """Record the final installation result."""
+    with _installation_lock:
+        _state.result = result
+        _state.in_progress = False
+        _state.completed.set()
+
+def _perform_bundled_then_gallery_install(settings):
+    """Install from the bundled zip, fall back to the PowerShell Gallery.
+
+    Always records a result, callers waiting for the installation would
+    otherwise wait forever.
+    """
+    try:
+        powershell_path = settings.get("windows_powershell_path", "powershell.exe")
+        
+        # Try installing from the bundled zip first
+        log.info("Attempting to install BurntToast from bundled zip")
+        result = _install_from_bundled_zip(powershell_path)
+        
+        if result:
+            _finish_install(True)
+            log.info("BurntToast installed successfully from bundled zip")
+            return True
+        
+        # If bundled installation failed, try PowerShell Gallery installation
+        log.info("Bundled installation failed, trying PowerShell Gallery installation")
         return _perform_install(settings)
+    except Exception as e:
+        log.error(f"Error installing BurntToast: {e}")
+        _finish_install(False)
+        return False
 
 def _perform_install(settings):
     """Internal function to perform the installation."""
-    global _installation_in_progress, _installation_completed, _installation_result
-    
     try:
         powershell_path = settings.get("windows_powershell_path", "powershell.exe")
         log.info("Installing BurntToast from PowerShell Gallery")
         
-        # Build installation script with more aggressive error handling
-        ps_script = """
-        # Set error preferences
-        $ErrorActionPreference = "Continue"
-        $ProgressPreference = "SilentlyContinue"
-        
-        # Trust the PSGallery
-        try {
-            Set-PSRepository -Name "PSGallery" -InstallationPolicy Trusted -ErrorAction SilentlyContinue
-        } catch {
-            Write-Output "Warning: Could not set PSGallery to trusted: $_"
-        }
-        
-        # Force TLS 1.2 for gallery connections
-        [Net.ServicePointManager]::SecurityProtocol = [Net.ServicePointManager]::SecurityProtocol -bor [Net.SecurityProtocolType]::Tls12
-        
-        try {
-            # Check if module is already installed
-            if (Get-Module -ListAvailable -Name BurntToast) {
-                Write-Output "BurntToast module is already installed"
-                exit 0
-            }
-            
-            # Create target directory
-            $moduleDir = "$HOME\\Documents\\WindowsPowerShell\\Modules\\BurntToast"
-            if (-not (Test-Path $moduleDir)) {
-                New-Item -Path $moduleDir -ItemType Directory -Force | Out-Null
-                Write-Output "Created directory: $moduleDir"
-            }
-            
-            # Install BurntToast
-            Write-Output "Installing BurntToast module..."
-            Install-Module -Name BurntToast -Scope CurrentUser -Force -AllowClobber -Verbose
-            
-            # Verify installation
-            if (Get-Module -ListAvailable -Name BurntToast) {
-                Write-Output "BurntToast module installed successfully"
-                exit 0
-            } else {
-                Write-Output "BurntToast module installation failed"
-                exit 1
-            }
-        } catch {
-            Write-Output "Error installing BurntToast: $_"
-            exit 1
-        }
-        """
-        
         # Run the PowerShell script
+        from .api.platforms.windows import _create_hidden_startupinfo, _powershell_args
         log.info("Running BurntToast installation commands")
         result = subprocess.run(
-            [powershell_path, "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
+            _powershell_args(powershell_path, _PS_INSTALL_SCRIPT, "-ExecutionPolicy", "Bypass"),
             capture_output=True,
-            text=True,
             check=False,
             startupinfo=_create_hidden_startupinfo()
         )
         
-        log.debug(f"PowerShell output: {result.stdout}")
-        if result.stderr:
-            log.debug(f"PowerShell error: {result.stderr}")
+        # The output is only decoded for the debug log
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"PowerShell output: {result.stdout.decode(errors='replace')}")
+            if result.stderr:
+                log.debug(f"PowerShell error: {result.stderr.decode(errors='replace')}")
         
         # Check if successful
-        success = "module is already installed" in result.stdout or "installed successfully" in result.stdout
+        success = b"module is already installed" in result.stdout or b"installed successfully" in result.stdout
         
         if success:
             log.info("BurntToast module installed successfully via PowerShell Gallery")
@@ -370,10 +680,7 @@ def _perform_install(settings):
             log.error("Failed to install BurntToast module via PowerShell Gallery")
         
         # Mark installation as complete with result
-        with _installation_lock:
-            _installation_in_progress = False
-            _installation_completed = True
-            _installation_result = success
+        _finish_install(success)
             
         return success
             
@@ -381,64 +688,68 @@ def _perform_install(settings):
         log.error(f"Error installing BurntToast: {e}")
         
         # Mark installation as failed
-        with _installation_lock:
-            _installation_in_progress = False
-            _installation_completed = True
-            _installation_result = False
+        _finish_install(False)
         
         return False
     
 def warmup_powershell_session(settings):
-    """Pre-load PowerShell and BurntToast module once to improve first notification speed."""
+    """Pre-load PowerShell and BurntToast module once to improve first notification speed.
+
+    The warm-up runs in the persistent PowerShell host that the Windows
+    platform sends its notifications to, so the loaded module and classes
+    stay around for them. A one-shot PowerShell is only used if the host
+    can't be started.
+    """
     # Skip if not on Windows
     if platform.system() != "Windows":
         return
         
     # Don't warm up if BurntToast isn't available
-    if not _installation_completed or not _installation_result:
+    if not _state.completed.is_set() or not _state.result:
         return
         
     try:
         log.debug("PowerShell session warm-up initiated")
         powershell_path = settings.get("windows_powershell_path", "powershell.exe")
         
-        # Create a script that loads the module and keeps it loaded
-        warmup_script = """
-        $ProgressPreference = "SilentlyContinue"
-        
-        # Check if module is available
-        $moduleAvailable = Get-Module -ListAvailable BurntToast
-        if (-not $moduleAvailable) {
-            Write-Output "BurntToast module is not available"
-            exit 1
-        }
-        
-        # Load the module and preload classes
-        Import-Module BurntToast -DisableNameChecking -Force
         
-        # Pre-load some .NET classes
-        $null = [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime]
-        $null = [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime]
-        
-        # Load the AppID
-        New-BTAppId -AppId "AYON.ToastNotify" -AppDisplayName "AYON ToastNotify" -ErrorAction SilentlyContinue
-        
-        Write-Output "Warmup completed successfully"
-        """
+        from .api.platforms.windows import (
+            PowerShellHostUnavailable,
+            _create_hidden_startupinfo,
+            _powershell_args,
+            run_in_powershell_host,
+        )
+        try:
+            ok, error = run_in_powershell_host(powershell_path, _PS_WARMUP_SCRIPT)
+        except PowerShellHostUnavailable as e:
+            log.debug(f"Persistent PowerShell host unavailable, warming up a one-shot session: {e}")
+        except RuntimeError as e:
+            log.warning(f"PowerShell warm-up failed: {e}")
+            return
+        else:
+            if ok:
+                log.info("PowerShell session warm-up complete")
+            else:
+                log.warning(f"PowerShell warm-up failed: {error}")
+            return
         
-        startupinfo = _create_hidden_startupinfo()
+        marker = Path(
+            tempfile.gettempdir(), f"ayon_bt_warm.{os.getpid()}.{secrets.token_hex(4)}.ok"
+        )
         result = subprocess.run(
-            [powershell_path, "-NoProfile", "-Command", warmup_script],
-            startupinfo=startupinfo,
-            capture_output=True,
-            text=True,
+            _powershell_args(powershell_path, _warmup_ps_with_marker(marker)),
+            startupinfo=_create_hidden_startupinfo(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False
         )
         
-        if "Warmup completed successfully" in result.stdout:
+        if marker.exists():
+            marker.unlink(missing_ok=True)
             log.info("PowerShell session warm-up complete")
         else:
-            log.warning(f"PowerShell warm-up returned unexpected output: {result.stdout}")
+            log.warning(f"PowerShell warm-up did not complete (exit code {result.returncode})")
             
     except Exception as e:
         log.debug(f"PowerShell warm-up failed: {e}")
\ No newline at end of file
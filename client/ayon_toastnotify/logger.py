@@ -2,8 +2,8 @@ import logging
 import os
 import sys
 import io
+import threading
 import traceback
-from functools import wraps
 
 # Dynamically determine addon name
 try:
@@ -12,13 +12,8 @@ try:
 except Exception:
     ADDON_NAME = os.path.basename(os.path.dirname(__file__))
 
-# Create a dedicated logs directory
+# Dedicated logs directory, only created once something is logged
 log_dir = os.path.join(os.path.expanduser("~"), ".ayon/logs")
-try:
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-except Exception:
-    pass  # Continue even if directory creation fails
 
 # Get a logger with a unique name
 log = logging.getLogger(f"ayon.{ADDON_NAME}")
@@ -58,45 +53,72 @@ class SafeStreamHandler(logging.StreamHandler):
         except Exception:
             # Never fail on logging
             pass
+    
+    def handleError(self, record):
+        # Never fail on logging, not even by printing a traceback
+        pass
 
-# Add file handler only if AYON_DEBUG is enabled
-if ayon_debug:
+def _create_handlers():
+    """Create the file (AYON_DEBUG only) and console handlers."""
+    handlers = []
+    
+    # Add file handler only if AYON_DEBUG is enabled
+    if ayon_debug:
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            file_path = os.path.join(log_dir, f"{ADDON_NAME}_debug.log")
+            file_handler = logging.FileHandler(file_path)
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            file_handler.setFormatter(formatter)
+            file_handler.setLevel(logging.DEBUG)
+            handlers.append(file_handler)
+        except Exception:
+            print(f"Failed to create log file in {log_dir}", file=sys.stderr)
+    
+    # Add console handler with explicit stream and error handling
     try:
-        file_path = os.path.join(log_dir, f"{ADDON_NAME}_debug.log")
-        file_handler = logging.FileHandler(file_path)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
-        log.addHandler(file_handler)
+        stream_handler = SafeStreamHandler(stream=sys.stderr)
+        stream_handler.setFormatter(logging.Formatter('%(name)s - %(levelname)s - %(message)s'))
+        stream_handler.setLevel(logging.DEBUG if ayon_debug else log.level)
+        handlers.append(stream_handler)
     except Exception:
-        print(f"Failed to create log file in {log_dir}")
+        if ayon_debug:
+            print("Failed to create console log handler", file=sys.stderr)
+    
+    return handlers
 
-# Add console handler with explicit stream and error handling
-try:
-    stream_handler = SafeStreamHandler(stream=sys.stderr)
-    stream_handler.setFormatter(logging.Formatter('%(name)s - %(levelname)s - %(message)s'))
-    stream_handler.setLevel(logging.DEBUG if ayon_debug else log.level)
-    log.addHandler(stream_handler)
-except Exception:
-    print("Failed to create console log handler")
+class DeferredHandler(logging.Handler):
+    """Forward records to the real handlers, creating them on first use.
 
-# Create safe logging methods that won't crash
-def safe_log(func):
-    @wraps(func)
-    def wrapper(msg, *args, **kwargs):
+    Importing the logger stays cheap this way, the log directory and the
+    log file are only touched once a record is actually emitted.
+    """
+    def __init__(self):
+        super().__init__()
+        self._handlers = None
+        self._setup_lock = threading.Lock()
+    
+    def _get_handlers(self):
+        if self._handlers is None:
+            with self._setup_lock:
+                if self._handlers is None:
+                    self._handlers = _create_handlers()
+        return self._handlers
+    
+    def emit(self, record):
         try:
-            return func(msg, *args, **kwargs)
+            for handler in self._get_handlers():
+                if record.levelno >= handler.level:
+                    handler.handle(record)
         except Exception:
-            # Last resort - print directly to console
-            print(f"SAFE LOG: {msg}")
-    return wrapper
+            # Never fail on logging
+            pass
+    
+    def handleError(self, record):
+        pass
 
-# Apply safe wrappers to all logging methods
-log.debug = safe_log(log.debug)
-log.info = safe_log(log.info)
-log.warning = safe_log(log.warning)
-log.error = safe_log(log.error)
-log.critical = safe_log(log.critical)
+log.addHandler(DeferredHandler())
 
-# Print confirmation that logger is initialized
-print(f"AYON {ADDON_NAME} logger initialized successfully")
\ No newline at end of file
+# Confirm that the logger is initialized, only when debugging
+if ayon_debug:
+    log.debug(f"AYON {ADDON_NAME} logger initialized successfully")
\ No newline at end of file